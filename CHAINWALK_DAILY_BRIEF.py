@@ -1,12 +1,85 @@
+import bisect
+import heapq
 import json
+import math
 import os
+import re
+import runpy
+import string
 import sys
-import subprocess
-from collections import Counter
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from operator import itemgetter
 from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+try:
+    import orjson
+except Exception:  # optional: stdlib json is the fallback
+    orjson = None
+
+try:
+    import ijson
+except Exception:  # optional: only used to stream very large signal files
+    ijson = None
+
+
+def _has_nonfinite(obj: Any) -> bool:
+    """True if ``obj`` holds a NaN/inf float, which orjson would write as null."""
+    if type(obj) is float:
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(map(_has_nonfinite, obj.values()))
+    if isinstance(obj, (list, tuple)):
+        return any(map(_has_nonfinite, obj))
+    return False
+
+
+def _encode(obj: Any, indent: bool) -> bytes:
+    """
+    UTF-8 JSON, via orjson when it's installed. Values orjson rejects or
+    would write differently (NaN/inf, ints wider than 64 bits) go through
+    json instead, so they come out as they always have.
+    """
+    if orjson is not None and not _has_nonfinite(obj):
+        try:
+            return orjson.dumps(obj, option=_ORJSON_INDENT if indent else _ORJSON_COMPACT)
+        except TypeError:
+            pass
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(obj).encode("utf-8")
+
+
+def _dumps(obj: Any) -> str:
+    return _encode(obj, True).decode("utf-8")
+
+
+def _dump_bytes(obj: Any) -> bytes:
+    return _encode(obj, True)
+
+
+def _dump_line(obj: Any) -> bytes:
+    return _encode(obj, False)
+
+
+if orjson is not None:
+    _ORJSON_COMPACT = orjson.OPT_NON_STR_KEYS
+    _ORJSON_INDENT = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+    def _loads(data: bytes) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects the NaN/Infinity literals json writes.
+            return json.loads(data)
+else:
+    _loads = json.loads
+
 
 # --- Ensure project root & core package on sys.path -------------------------
 
@@ -14,65 +87,32 @@ ROOT = Path(__file__).resolve().parent
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from core.regime_metrics import compute_snapshot, ChainTensionSnapshot
-from core.brief_renderer import render_apex_brief
-from utils.memory_of_price import update_memory_state, MemorySnapshot
-from utils.price_corridor_engine import compute_corridor
-from renderers.price_corridor_renderer import render_price_corridor
-from utils.regime_tracker import classify_regime
-from renderers.regime_renderer import render_regime_section
-from utils.scoreboard_loader import load_scoreboard_state
-from utils.wavefunction import scores_to_wavefunction
-from utils.regime_hamiltonian import compute_regime_horizon, REGIME_BASIS
-from utils.regime_clock import compute_regime_clock, regime_clock_to_json
-from utils.intent_clock import compute_intent_clock, intent_clock_to_json
-from utils.incentive import compute_drivers, compute_incentive_delta, has_incentive_conflict
-from utils.trapdoor import compute_trapdoor
-from utils.spine import build_spine_line
-from utils.mempool_intent import (
-    compute_mempool_intent,
-    mempool_intent_to_json,
-)
-from utils.apex_deck import build_apex_deck
-from utils.hashrate_oracle import HashrateInputs, hashrate_to_json
-from utils.miner_threshold import compute_miner_threshold, to_state_dict
-from utils.outcome_engine import append_outcome_snapshot
-from utils.difficulty_epoch import compute_epoch_tension, save_difficulty_epoch_state
-from utils.miner_cohorts import compute_miner_cohort_tilt, save_miner_cohort_tilt
-from utils.irreversibility_engine import compute_irq
-from utils.resolution_engine import compute_resolution_index
-from utils.uncertainty_engine import compute_uqi
-from utils import alert_rail
-from utils.oracle_fingerprint import compute_oracle_input_hash
+from utils.oracle_fingerprint import safe_str_tail
+
+if TYPE_CHECKING:
+    from core.regime_metrics import ChainTensionSnapshot
+
 
 def format_regime_horizon_line(ham_state) -> str:
     """
     Returns e.g. '51% COMPRESSION → 34% ASCENT → 10% DISTRIBUTION → 5% STARVATION'
     """
     basis = ham_state["basis"]
-    p_horizon = ham_state["p_horizon"]
-    pairs = list(zip(basis, p_horizon))
-    pairs.sort(key=lambda x: x[1], reverse=True)
-    percents = []
-    for name, prob in pairs:
-        if prob >= 0.01:  # >=1%
-            percents.append(int(round(prob * 100)))
-        else:
-            percents.append(0)
+    p_horizon = list(ham_state["p_horizon"])
+    # Stable descending order of basis indices by probability.
+    order = sorted(range(len(p_horizon)), key=p_horizon.__getitem__, reverse=True)
+    percents = [
+        int(round(p_horizon[i] * 100)) if p_horizon[i] >= 0.01 else 0  # >=1%
+        for i in order
+    ]
     # Adjust to sum to 100
-    total = sum(percents)
-    if total != 100:
-        diff = 100 - total
+    diff = 100 - sum(percents)
+    if diff:
         percents[0] += diff  # Add to highest
-    # Filter out zeros
-    filtered = [(name, p) for name, p in zip([p[0] for p in pairs], percents) if p > 0]
-    return " -> ".join(f"{p}% {name}" for name, p in filtered)
-from ui.scorecard import render_scorecard
-from datetime import datetime, timezone
-import json
+    return " -> ".join(f"{p}% {basis[i]}" for i, p in zip(order, percents) if p > 0)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BriefStats:
     block_count: int
     height_min: int
@@ -100,36 +140,118 @@ class BriefStats:
     interesting_blocks: List[Dict[str, Any]] = field(default_factory=list)
 
 
+# Interesting-block flags as bits; _FLAG_NAMES[mask] lists them in report order.
+_FLAG_WHALE = 1
+_FLAG_POLY = 2
+_FLAG_FEE = 4
+_FLAG_ENTROPY = 8
+_FLAG_LABELS = ("whale-tx", "polyphonic", "high-fee-pressure", "high-entropy")
+_FLAG_NAMES = tuple(
+    tuple(label for bit, label in enumerate(_FLAG_LABELS) if mask >> bit & 1)
+    for mask in range(1 << len(_FLAG_LABELS))
+)
+
+
 def _safe_float(v: Any, default: float = 0.0) -> float:
     if v is None:
         return default
-    try:
+    # JSON numbers arrive as exact floats/ints; skip the try for those.
+    cls = v.__class__
+    if cls is float:
+        return v
+    if cls is int:
         return float(v)
-    except (ValueError, TypeError):
-        return default
-
-
-
     try:
         return float(v)
-    except Exception:
+    except (ValueError, TypeError):
         return default
 
 
 def _safe_int(v: Any, default: int = 0) -> int:
     if v is None:
         return default
+    if v.__class__ is int:
+        return v
     try:
         return int(v)
     except Exception:
         return default
 
 
-def load_latest_signals(path: Path) -> Dict[str, Any]:
+def _top_n(counter: Mapping[str, int], n: int) -> List[Tuple[str, int]]:
+    """
+    Same result as Counter.most_common(n). Pool/channel tallies hold a
+    handful of keys, where a plain sort beats most_common's heap setup.
+    """
+    if n == 1:
+        return [max(counter.items(), key=itemgetter(1))] if counter else []
+    if len(counter) <= 64:
+        return sorted(counter.items(), key=itemgetter(1), reverse=True)[:n]
+    return heapq.nlargest(n, counter.items(), key=itemgetter(1))
+
+
+def _canonicalize_signal(s: Dict[str, Any]) -> None:
+    """
+    Resolve the field aliases a signal may carry into fixed, pre-coerced
+    `_`-prefixed keys so the stats loop does a single lookup per field, and
+    fold the entropy_h / complexity_k / largest_tx aliases into their
+    canonical keys.
+    """
+    g = s.get
+    raw_ent = g("entropy")
+    raw_cplx = g("complexity")
+    s["_height"] = _safe_int(g("height"))
+    s["_ts"] = _safe_int(g("timestamp"), 0)
+    s["_tx_count"] = _safe_int(g("tx_count"), 0)
+    s["_total_out"] = _safe_float(g("total_output_btc") or g("total_out_btc") or g("total_out"))
+    s["_fees"] = _safe_float(g("total_fee_btc") or g("fees_btc") or g("fees"))
+    s["_largest"] = _safe_float(g("largest_tx_btc") or g("largest_btc") or g("largest"))
+    s["_entropy"] = None if raw_ent is None else _safe_float(raw_ent)
+    s["_complexity"] = None if raw_cplx is None else _safe_float(raw_cplx)
+    # ~20 distinct pool names across the whole file: share one string each.
+    s["_pool"] = sys.intern((g("pool") or "unknown").strip() or "unknown")
+
+    # Fold legacy alias keys into the canonical ones, so consumers that read
+    # the raw signal (compute_snapshot) usually need a single lookup per
+    # field. An existing canonical value is never replaced (the window sums
+    # read it), and a None alias is dropped rather than stored.
+    for alias, key in (("entropy_h", "entropy"), ("complexity_k", "complexity")):
+        if alias in s and key not in s:
+            v = s.pop(alias)
+            if v is not None:
+                s[key] = v
+    if "largest_tx" in s:
+        lt = g("largest_tx_btc") or s.pop("largest_tx")
+        if lt is not None:
+            s["largest_tx_btc"] = lt
+
+
+# Above this size, a tail-limited load streams the signals array with ijson
+# (when installed) instead of decoding the whole document at once.
+_STREAM_MIN_BYTES = 64 * 1024 * 1024
+
+
+def load_latest_signals(path: Path, limit: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Load sovereign_signals_latest.json and canonicalize its signals.
+
+    With ``limit``, only the last ``limit`` signals are kept. Large files are
+    then streamed, keeping at most ``limit`` records in memory, and the result
+    holds just the ``signals`` key.
+    """
     if not path.exists():
         raise FileNotFoundError(f"latest signals JSON not found: {path}")
-    with path.open("r", encoding="utf-8") as f:
-        data = json.load(f)
+    if limit is not None and ijson is not None and path.stat().st_size >= _STREAM_MIN_BYTES:
+        with path.open("rb") as f:
+            tail = deque(ijson.items(f, "signals.item", use_float=True), maxlen=limit)
+        data: Dict[str, Any] = {"signals": list(tail)}
+    else:
+        with path.open("rb") as f:
+            data = _loads(f.read())
+        if limit is not None and data.get("signals"):
+            data["signals"] = data["signals"][-limit:]
+    for s in data.get("signals") or []:
+        _canonicalize_signal(s)
     return data
 
 
@@ -138,122 +260,113 @@ def compute_stats(data: Dict[str, Any]) -> BriefStats:
     if not signals:
         raise ValueError("No signals found in sovereign_signals_latest.json")
 
-    signals = sorted(signals, key=lambda s: _safe_int(s.get("height")))
+    # Signals loaded via load_latest_signals are already canonical.
+    if "_pool" not in signals[0]:
+        for s in signals:
+            _canonicalize_signal(s)
 
-    heights = [_safe_int(s.get("height")) for s in signals]
-    ts_list = [_safe_int(s.get("timestamp"), 0) for s in signals if s.get("timestamp")]
+    signals = sorted(signals, key=itemgetter("_height"))
 
     block_count = len(signals)
-    height_min = min(heights) if heights else 0
-    height_max = max(heights) if heights else 0
-    t_start = min(ts_list) if ts_list else None
-    t_end = max(ts_list) if ts_list else None
-
-    # Tx stats
-    tx_counts = [_safe_int(s.get("tx_count"), 0) for s in signals]
-    total_txs = sum(tx_counts)
-    avg_txs_per_block = total_txs / block_count if block_count else 0.0
-
-    # Finance stats
-    total_out_btc = sum(
-        _safe_float(s.get("total_output_btc") or s.get("total_out_btc") or s.get("total_out"))
-        for s in signals
-    )
-    total_fees_btc = sum(
-        _safe_float(s.get("total_fee_btc") or s.get("fees_btc") or s.get("fees"))
-        for s in signals
-    )
-    avg_fees_per_block = total_fees_btc / block_count if block_count else 0.0
+    height_min = signals[0]["_height"]
+    height_max = signals[-1]["_height"]
 
-    # Entropy / complexity
-    entropies = [_safe_float(s.get("entropy")) for s in signals if s.get("entropy") is not None]
-    complexities = [_safe_float(s.get("complexity")) for s in signals if s.get("complexity") is not None]
-    avg_entropy = sum(entropies) / len(entropies) if entropies else 0.0
-    avg_complexity = sum(complexities) / len(complexities) if complexities else 0.0
+    whale_threshold = _safe_float(os.environ.get("CHAINWALK_WHALE_THRESHOLD", "100.0"), 100.0)
+    fee_ratio_threshold = 0.02  # 2% fees / value is quite spicy
 
-    # Polyphonic
-    polyphonic_flags = [bool(s.get("polyphonic")) for s in signals]
-    polyphonic_count = sum(1 for p in polyphonic_flags if p)
-    polyphonic_rate = polyphonic_count / block_count if block_count else 0.0
+    # Single pass over the window: running sums, tallies and per-block rows.
+    # The high-entropy flag depends on the window average, so it is applied
+    # in a short second sweep over the collected rows.
+    t_start: Optional[int] = None
+    t_end: Optional[int] = None
+    total_txs = 0
+    total_out_btc = 0.0
+    total_fees_btc = 0.0
+    sum_entropy = 0.0
+    n_entropy = 0
+    sum_complexity = 0.0
+    n_complexity = 0
+    polyphonic_count = 0
+    pool_counts: Dict[str, int] = {}
+    chan_counts: Dict[str, int] = {}
+    rows: List[Tuple[Any, ...]] = []
 
-    # Pools
-    pool_counter: Counter = Counter()
     for s in signals:
-        pool = (s.get("pool") or "unknown").strip() or "unknown"
-        pool_counter[pool] += 1
-    top_pools = pool_counter.most_common(5)
+        g = s.get
+        height = s["_height"]
+        ts = s["_ts"]
+        if ts:
+            if t_start is None or ts < t_start:
+                t_start = ts
+            if t_end is None or ts > t_end:
+                t_end = ts
+
+        tx_count = s["_tx_count"]
+        total_txs += tx_count
+
+        total_out = s["_total_out"]
+        fees = s["_fees"]
+        largest = s["_largest"]
+        total_out_btc += total_out
+        total_fees_btc += fees
+
+        ent = s["_entropy"]
+        if ent is not None:
+            sum_entropy += ent
+            n_entropy += 1
+        else:
+            ent = 0.0
+        cplx = s["_complexity"]
+        if cplx is not None:
+            sum_complexity += cplx
+            n_complexity += 1
 
-    # Channels
-    chan_counter: Counter = Counter()
-    for s in signals:
-        ch = s.get("channels") or {}
+        poly = bool(g("polyphonic"))
+        if poly:
+            polyphonic_count += 1
+
+        pool = s["_pool"]
+        pool_counts[pool] = pool_counts.get(pool, 0) + 1
+
+        ch = g("channels") or {}
         if isinstance(ch, dict):
             for k, v in ch.items():
                 if v:
-                    chan_counter[k] += 1
-    top_channels = chan_counter.most_common(8)
-
-    # Whale threshold
-    whale_threshold = _safe_float(os.environ.get("CHAINWALK_WHALE_THRESHOLD", "100.0"), 100.0)
+                    chan_counts[k] = chan_counts.get(k, 0) + 1
 
-    whales: List[Dict[str, Any]] = []
-    for s in signals:
-        largest = _safe_float(
-            s.get("largest_tx_btc") or s.get("largest_btc") or s.get("largest")
-        )
+        mask = _FLAG_POLY if poly else 0
         if largest >= whale_threshold:
-            whales.append(
-                {
-                    "height": _safe_int(s.get("height")),
-                    "timestamp": _safe_int(s.get("timestamp"), 0),
-                    "pool": (s.get("pool") or "unknown").strip() or "unknown",
-                    "largest_tx_btc": largest,
-                    "total_output_btc": _safe_float(
-                        s.get("total_output_btc") or s.get("total_out_btc") or s.get("total_out")
-                    ),
-                    "tx_count": _safe_int(s.get("tx_count"), 0),
-                    "polyphonic": bool(s.get("polyphonic")),
-                }
-            )
+            mask |= _FLAG_WHALE
 
-    whales = sorted(whales, key=lambda w: w["largest_tx_btc"], reverse=True)[:8]
+        fee_ratio = fees / total_out if total_out > 0 else 0.0
+        if fee_ratio >= fee_ratio_threshold:
+            mask |= _FLAG_FEE
+        rows.append((mask, height, ts, pool, tx_count, largest, total_out, fees, fee_ratio, ent, poly))
 
-    # "Interesting" blocks = whales OR high fees OR noisy/polyphonic structure
-    interesting: List[Dict[str, Any]] = []
-    fee_ratio_threshold = 0.02  # 2% fees / value is quite spicy
-    ent_high_threshold = avg_entropy + 0.7 if entropies else None
+    avg_txs_per_block = total_txs / block_count
+    avg_fees_per_block = total_fees_btc / block_count
+    avg_entropy = sum_entropy / n_entropy if n_entropy else 0.0
+    avg_complexity = sum_complexity / n_complexity if n_complexity else 0.0
+    polyphonic_rate = polyphonic_count / block_count
 
-    for s in signals:
-        height = _safe_int(s.get("height"))
-        ts = _safe_int(s.get("timestamp"), 0)
-        pool = (s.get("pool") or "unknown").strip() or "unknown"
-        tx_count = _safe_int(s.get("tx_count"), 0)
-        poly = bool(s.get("polyphonic"))
-
-        largest = _safe_float(
-            s.get("largest_tx_btc") or s.get("largest_btc") or s.get("largest")
-        )
-        total_out = _safe_float(
-            s.get("total_output_btc") or s.get("total_out_btc") or s.get("total_out")
-        )
-        fees = _safe_float(
-            s.get("total_fee_btc") or s.get("fees_btc") or s.get("fees")
-        )
-        fee_ratio = fees / total_out if total_out > 0 else 0.0
+    top_pools = _top_n(pool_counts, 5)
+    top_channels = _top_n(chan_counts, 8)
 
-        ent = _safe_float(s.get("entropy"))
-        flags: List[str] = []
+    # "Interesting" blocks = whales OR high fees OR noisy/polyphonic structure.
+    # Whales are always interesting, so they share the same record.
+    interesting: List[Dict[str, Any]] = []
+    interesting_keys: List[Tuple[float, float, float, int]] = []
+    whale_keys: List[Tuple[float, int]] = []
+    ent_high_threshold = avg_entropy + 0.7 if n_entropy else None
 
-        if largest >= whale_threshold:
-            flags.append("whale-tx")
-        if poly:
-            flags.append("polyphonic")
-        if fee_ratio >= fee_ratio_threshold:
-            flags.append("high-fee-pressure")
+    for mask, height, ts, pool, tx_count, largest, total_out, fees, fee_ratio, ent, poly in rows:
         if ent_high_threshold is not None and ent >= ent_high_threshold:
-            flags.append("high-entropy")
+            mask |= _FLAG_ENTROPY
 
-        if flags:
+        if mask:
+            if mask & _FLAG_WHALE:
+                whale_keys.append((-largest, len(interesting)))
+            interesting_keys.append((-largest, -fee_ratio, -ent, len(interesting)))
             interesting.append(
                 {
                     "height": height,
@@ -266,19 +379,15 @@ def compute_stats(data: Dict[str, Any]) -> BriefStats:
                     "fee_ratio": fee_ratio,
                     "entropy": ent,
                     "polyphonic": poly,
-                    "flags": flags,
+                    "flags": list(_FLAG_NAMES[mask]),
                 }
             )
 
+    # Rank on pre-extracted numeric keys; the index keeps ties in window order.
+    whales = [interesting[i] for _, i in heapq.nsmallest(8, whale_keys)]
+
     # Sort interesting: whales first, then fee ratio, then entropy
-    interesting = sorted(
-        interesting,
-        key=lambda b: (
-            -_safe_float(b.get("largest_tx_btc")),
-            -_safe_float(b.get("fee_ratio")),
-            -_safe_float(b.get("entropy")),
-        ),
-    )[:12]
+    interesting = [interesting[k[-1]] for k in heapq.nsmallest(12, interesting_keys)]
 
     return BriefStats(
         block_count=block_count,
@@ -302,66 +411,144 @@ def compute_stats(data: Dict[str, Any]) -> BriefStats:
     )
 
 
+@dataclass(slots=True)
+class _WindowTotals:
+    count: int = 0
+    height_min: Any = 0
+    height_max: Any = 0
+    ts_min: Any = None
+    ts_max: Any = None
+    tx_count: Any = 0
+    total_output_btc: Any = 0
+    total_fee_btc: Any = 0
+    entropy: Any = 0
+    compression_ratio: Any = 0
+
+
+def _window_totals(window: List[Dict[str, Any]]) -> _WindowTotals:
+    """
+    One pass over the raw window signals for the sums and extremes main()
+    needs, using the same raw fields and defaults as before.
+    """
+    t = _WindowTotals(count=len(window))
+    if not window:
+        return t
+    first = window[0]
+    h_min = h_max = first.get("height", 0)
+    ts_min = ts_max = first.get("timestamp", 0)
+    txs = out = fees = ent = cplx = 0
+    for s in window:
+        g = s.get
+        h = g("height", 0)
+        if h < h_min:
+            h_min = h
+        elif h > h_max:
+            h_max = h
+        ts = g("timestamp", 0)
+        if ts < ts_min:
+            ts_min = ts
+        elif ts > ts_max:
+            ts_max = ts
+        txs += g("tx_count", 0)
+        out += g("total_output_btc", 0)
+        fees += g("total_fee_btc", 0)
+        ent += g("entropy", 0)
+        cplx += g("compression_ratio", 0)
+    t.height_min, t.height_max = h_min, h_max
+    t.ts_min, t.ts_max = ts_min, ts_max
+    t.tx_count, t.total_output_btc, t.total_fee_btc = txs, out, fees
+    t.entropy, t.compression_ratio = ent, cplx
+    return t
+
+
+_UTC = timezone.utc
+
+
+@lru_cache(maxsize=4096)
 def _fmt_time(ts: Optional[int]) -> str:
     if not ts:
         return "—"
     try:
-        return datetime.fromtimestamp(ts, tz=timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
+        return datetime.fromtimestamp(ts, tz=_UTC).strftime("%Y-%m-%d %H:%M:%S UTC")
     except Exception:
         return str(ts)
 
 
-def build_facts_text(stats: BriefStats) -> str:
-    lines: List[str] = []
-
-    lines.append("WINDOW")
-    lines.append(f"- Blocks: {stats.block_count} (heights {stats.height_min} → {stats.height_max})")
-    lines.append(f"- Time span: {_fmt_time(stats.t_start)} → {_fmt_time(stats.t_end)}")
-    lines.append("")
-
-    lines.append("NETWORK ACTIVITY")
-    lines.append(f"- Total txs: {stats.total_txs:,} (avg {stats.avg_txs_per_block:,.1f} txs/block)")
-    lines.append(f"- Total BTC moved (approx): {stats.total_out_btc:,.3f} BTC")
-    lines.append(f"- Total fees: {stats.total_fees_btc:,.3f} BTC (avg {stats.avg_fees_per_block:,.4f} BTC/block)")
-    lines.append("")
-
-    lines.append("STRUCTURE")
-    lines.append(f"- Avg entropy H: {stats.avg_entropy:,.3f}")
-    lines.append(f"- Avg complexity K: {stats.avg_complexity:,.3f}")
-    lines.append(
+def _facts_header(stats: BriefStats) -> Tuple[str, ...]:
+    return (
+        "WINDOW",
+        f"- Blocks: {stats.block_count} (heights {stats.height_min} → {stats.height_max})",
+        f"- Time span: {_fmt_time(stats.t_start)} → {_fmt_time(stats.t_end)}",
+        "",
+        "NETWORK ACTIVITY",
+        f"- Total txs: {stats.total_txs:,} (avg {stats.avg_txs_per_block:,.1f} txs/block)",
+        f"- Total BTC moved (approx): {stats.total_out_btc:,.3f} BTC",
+        f"- Total fees: {stats.total_fees_btc:,.3f} BTC (avg {stats.avg_fees_per_block:,.4f} BTC/block)",
+        "",
+        "STRUCTURE",
+        f"- Avg entropy H: {stats.avg_entropy:,.3f}",
+        f"- Avg complexity K: {stats.avg_complexity:,.3f}",
         f"- Polyphonic blocks: {stats.polyphonic_count}/{stats.block_count} "
-        f"(~{stats.polyphonic_rate*100:,.1f}%)"
+        f"(~{stats.polyphonic_rate*100:,.1f}%)",
+        "",
     )
-    lines.append("")
 
-    lines.append("MINING POOLS (top)")
+
+def _facts_pools(stats: BriefStats) -> Iterator[str]:
+    yield "MINING POOLS (top)"
     for pool, count in stats.top_pools:
-        lines.append(f"- {pool}: {count} blocks")
+        yield f"- {pool}: {count} blocks"
     if not stats.top_pools:
-        lines.append("- (no pool data)")
-    lines.append("")
+        yield "- (no pool data)"
+    yield ""
+
 
-    lines.append("CHANNELS (top)")
+def _facts_channels(stats: BriefStats) -> Iterator[str]:
+    yield "CHANNELS (top)"
     for ch, count in stats.top_channels:
-        lines.append(f"- {ch}: {count} blocks with this channel active")
+        yield f"- {ch}: {count} blocks with this channel active"
     if not stats.top_channels:
-        lines.append("- (no channel data)")
-    lines.append("")
+        yield "- (no channel data)"
+    yield ""
 
-    lines.append("INTERESTING BLOCKS (summary)")
+
+def _facts_interesting(stats: BriefStats) -> Iterator[str]:
+    yield "INTERESTING BLOCKS (summary)"
     if stats.interesting_blocks:
         for b in stats.interesting_blocks:
             tag_str = ",".join(b.get("flags", []))
-            lines.append(
+            yield (
                 f"- height {b['height']} · pool {b['pool']} · "
                 f"largest_tx≈{b['largest_tx_btc']:,.3f} BTC · "
                 f"fees≈{b['fees_btc']:,.4f} BTC · tags=[{tag_str}]"
             )
     else:
-        lines.append("- none strongly out of line in this window")
-    lines.append("")
+        yield "- none strongly out of line in this window"
+    yield ""
 
-    return "\n".join(lines)
+
+def build_facts_text(stats: BriefStats) -> str:
+    return "\n".join(
+        chain(
+            _facts_header(stats),
+            _facts_pools(stats),
+            _facts_channels(stats),
+            _facts_interesting(stats),
+        )
+    )
+
+
+# Bucket edges for the label ladders below: value < edges[i] -> labels[i].
+_FEE_REGIME_EDGES = (0.001, 0.01)
+_FEE_REGIME_LABELS = ("low", "normal", "high")
+_BLOCK_FEE_EDGES = (0.01, 1.0)
+_BLOCK_FEE_LABELS = ("calm", "neutral", "chaos")
+_POLY_REGIME_EDGES = (0.1, 0.5)
+_POLY_REGIME_LABELS = ("calm", "neutral", "stress")
+
+
+def _bucket_label(edges: Tuple[float, ...], labels: Tuple[str, ...], value: float) -> str:
+    return labels[bisect.bisect_right(edges, value)]
 
 
 def build_chainwalk_json(stats: BriefStats) -> str:
@@ -372,7 +559,7 @@ def build_chainwalk_json(stats: BriefStats) -> str:
     price = {"btc_usd": 95000.0, "btc_change_24h_pct": 2.5, "realized_vol_24h": None}  # Placeholder
 
     # Network
-    fee_regime = "low" if stats.avg_fees_per_block < 0.001 else "normal" if stats.avg_fees_per_block < 0.01 else "high"
+    fee_regime = _bucket_label(_FEE_REGIME_EDGES, _FEE_REGIME_LABELS, stats.avg_fees_per_block)
     network = {
         "blocks": stats.block_count,
         "polyphonic_rate": stats.polyphonic_rate,
@@ -385,8 +572,28 @@ def build_chainwalk_json(stats: BriefStats) -> str:
     }
 
     # Flows
-    whale_count = len([b for b in stats.interesting_blocks if "whale" in str(b.get("flags", []))])
-    whale_volume = sum(b.get("largest_tx_btc", 0) for b in stats.interesting_blocks if "whale" in str(b.get("flags", [])))
+    # One sweep over the interesting blocks feeds both the whale flow totals
+    # and the spike list for the anomalies section.
+    whale_count = 0
+    whale_volume = 0
+    spike_blocks = []
+    for idx, b in enumerate(stats.interesting_blocks):
+        if "whale-tx" in b.get("flags", ()):
+            whale_count += 1
+            whale_volume += b.get("largest_tx_btc", 0)
+        if idx < 5:
+            fee_label = _bucket_label(_BLOCK_FEE_EDGES, _BLOCK_FEE_LABELS, b.get("fees_btc", 0))
+            spike_blocks.append({
+                "height": b["height"],
+                "score": b.get("score", 0),
+                "entropy_h": b.get("entropy", 0),
+                "complexity_k": b.get("complexity", 0),
+                "fee_pressure_label": fee_label,
+                "finance_line": b.get("finance_note", ""),
+                "channels": b.get("flags", []),
+                "docent_headline": b.get("story", "").split("\n")[0] if b.get("story") else None
+            })
+
     flows = {
         "whale_tx_count": whale_count,
         "whale_volume_btc": whale_volume,
@@ -405,26 +612,13 @@ def build_chainwalk_json(stats: BriefStats) -> str:
     }
 
     # Anomalies
-    spike_blocks = []
-    for b in stats.interesting_blocks[:5]:
-        fee_label = "calm" if b.get("fees_btc", 0) < 0.01 else "neutral" if b.get("fees_btc", 0) < 1 else "chaos"
-        spike_blocks.append({
-            "height": b["height"],
-            "score": b.get("score", 0),
-            "entropy_h": b.get("entropy", 0),
-            "complexity_k": b.get("complexity", 0),
-            "fee_pressure_label": fee_label,
-            "finance_line": b.get("finance_note", ""),
-            "channels": b.get("flags", []),
-            "docent_headline": b.get("story", "").split("\n")[0] if b.get("story") else None
-        })
     anomalies = {
         "spike_blocks": spike_blocks,
         "quiet_stretches": []  # Placeholder
     }
 
     # Regime inference
-    regime_label = "calm" if stats.polyphonic_rate < 0.1 else "neutral" if stats.polyphonic_rate < 0.5 else "stress"
+    regime_label = _bucket_label(_POLY_REGIME_EDGES, _POLY_REGIME_LABELS, stats.polyphonic_rate)
     regime_inference = {
         "label": regime_label,
         "basis": f"Polyphonic rate {stats.polyphonic_rate:.1%}, fees {fee_regime}",
@@ -442,11 +636,10 @@ def build_chainwalk_json(stats: BriefStats) -> str:
         "regime_inference": regime_inference
     }
 
-    return json.dumps(chainwalk_json, ensure_ascii=False, indent=2)
+    return _dumps(chainwalk_json)
 
 
-def build_llm_prompt(chainwalk_json: str) -> str:
-    system_prompt = """You are CHAINWALK DESK, the in-house Bitcoin & macro research engine for an elite trading desk.
+_SYSTEM_PROMPT = """You are CHAINWALK DESK, the in-house Bitcoin & macro research engine for an elite trading desk.
 
 You speak in Hybrid Apex Mode:
 - Saylor-style conviction about Bitcoin’s long-term inevitability
@@ -483,13 +676,15 @@ Target output:
 - Structured with clear section headings.
 - Written so a human could easily pull 1–3 tweet-sized hooks from it."""
 
-    user_prompt = f"""You are preparing today’s ChainWalk Desk SITREP.
+_USER_HEAD = """You are preparing today’s ChainWalk Desk SITREP.
 
 Here is the structured snapshot of the last 24 hours
 of Bitcoin network activity, already pre-aggregated for you:
 
 ```json
-{chainwalk_json}
+"""
+
+_USER_TAIL = """
 ```
 
 Use this dataset to write a second-to-none Bitcoin daily situation report.
@@ -572,7 +767,9 @@ You may use headings like “### Network Regime” etc.
 
 Don’t ever say “I was given JSON” or “the model says”. Just speak as ChainWalk Desk."""
 
-    return system_prompt, user_prompt
+
+def build_llm_prompt(chainwalk_json: str) -> Tuple[str, str]:
+    return _SYSTEM_PROMPT, _USER_HEAD + chainwalk_json + _USER_TAIL
 
 
 def generate_brief_text(stats: BriefStats, facts: str) -> str:
@@ -649,19 +846,17 @@ def build_markdown(stats: BriefStats, facts: str, brief_text: str) -> str:
     dt_end = _fmt_time(stats.t_end)
     date_label = dt_end.split(" ")[0] if dt_end != "—" else datetime.now(tz=timezone.utc).strftime("%Y-%m-%d")
 
-    lines: List[str] = []
-
-    lines.append(f"# ChainWalk Desk – Daily Bitcoin SITREP ({date_label})")
-    lines.append("")
-    lines.append(f"**Window:** Last 24 hours · Blocks {stats.height_min} to {stats.height_max}")
-    lines.append("")
-    lines.append("---")
-    lines.append("")
-    lines.append(brief_text)
-    lines.append("")
-    lines.append("> Generated by **ChainWalk Desk** on your local node.")
-
-    return "\n".join(lines)
+    return (
+        f"# ChainWalk Desk – Daily Bitcoin SITREP ({date_label})\n"
+        "\n"
+        f"**Window:** Last 24 hours · Blocks {stats.height_min} to {stats.height_max}\n"
+        "\n"
+        "---\n"
+        "\n"
+        f"{brief_text}\n"
+        "\n"
+        "> Generated by **ChainWalk Desk** on your local node."
+    )
 
 
 def save_markdown_report(md: str, stats: BriefStats, out_dir: Path) -> Path:
@@ -678,128 +873,294 @@ def save_markdown_report(md: str, stats: BriefStats, out_dir: Path) -> Path:
     return out_path
 
 
+# Parsed report files keyed by path; an entry is reused only while the file's
+# (mtime_ns, size) still matches, so anything rewritten on disk is re-read.
+_JSON_CACHE: Dict[str, Tuple[int, int, Any]] = {}
+
+
+def _load_json(path: Path, default: Any = None) -> Any:
+    """
+    Parse a JSON report file, reusing the previous parse if the file has not
+    changed since. Returns ``default`` when the file does not exist; parse
+    errors are raised to the caller.
+    """
+    key = str(path)
+    try:
+        st = os.stat(key)
+    except FileNotFoundError:
+        return default
+    hit = _JSON_CACHE.get(key)
+    if hit is not None and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+        return hit[2]
+    with open(key, "rb") as f:
+        data = _loads(f.read())
+    _JSON_CACHE[key] = (st.st_mtime_ns, st.st_size, data)
+    return data
+
+
+def _write_json(path: Path, obj: Any) -> None:
+    """
+    Serialize ``obj`` as indented JSON and write it in one call. If the file
+    already holds exactly these bytes it is left untouched (no rewrite, no
+    mtime bump for file watchers).
+    """
+    data = _dump_bytes(obj)
+    try:
+        if os.stat(path).st_size == len(data) and path.read_bytes() == data:
+            return
+    except OSError:
+        pass
+    path.write_bytes(data)
+    # mtime granularity can be coarser than a fast rewrite; never trust a
+    # cached parse of a file this process just replaced.
+    _JSON_CACHE.pop(str(path), None)
+
+
+def append_wavefunction(records: Iterable[Dict[str, Any]], path: Path) -> None:
+    """
+    Append wavefunction records to a JSONL log through one buffered handle,
+    so replaying many days costs a single open/close.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "ab", buffering=1 << 20) as f:
+        for r in records:
+            f.write(_dump_line(r) + b"\n")
+
+
+def _write_line_files(line: str, latest_path: Path, history_path: Path) -> None:
+    """
+    Replace ``latest_path`` with ``line`` and append it to ``history_path``.
+    The line is encoded once and each file gets a single raw write; the
+    history log is opened O_APPEND per call, so a rotated or deleted log is
+    picked up on the next run. No fsync: it's a log, not a journal.
+    """
+    payload = (line + "\n").encode("utf-8")
+    fd = os.open(latest_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, payload)
+    finally:
+        os.close(fd)
+    hfd = os.open(history_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    try:
+        os.write(hfd, payload)
+    finally:
+        os.close(hfd)
+
+
 def load_previous_snapshot(reports_dir: Path) -> Optional[Dict[str, Any]]:
-    state_path = reports_dir / "chainwalk_daily_state.json"
-    if state_path.exists():
-        try:
-            with open(state_path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception:
-            pass
-    return None
+    try:
+        return _load_json(reports_dir / "chainwalk_daily_state.json")
+    except Exception:
+        return None
+
+_POST_STATE_FILES = (
+    "regime_clock_state.json",
+    "mempool_intent_state.json",
+    "intent_clock_state.json",
+)
+
+
+def _read_state_file(path: str) -> Any:
+    try:
+        with open(path, "rb") as f:
+            return _loads(f.read())
+    except Exception:
+        return None
+
+
+def _load_state_bundle(reports_dir: Path, names: Tuple[str, ...] = _POST_STATE_FILES) -> Dict[str, Dict[str, Any]]:
+    """
+    Read the small JSON state files the post template needs with a single
+    directory scan. Missing or unreadable files are simply left out.
+    """
+    wanted = set(names)
+    try:
+        with os.scandir(reports_dir) as it:
+            paths = {e.name: e.path for e in it if e.name in wanted}
+    except FileNotFoundError:
+        return {}
+
+    if not paths:
+        return {}
+
+    # Reads are I/O bound, so overlap them; results keep the scan order.
+    with ThreadPoolExecutor(max_workers=len(paths)) as ex:
+        results = ex.map(_read_state_file, paths.values())
+        return {
+            name: data
+            for name, data in zip(paths, results)
+            if isinstance(data, dict)
+        }
+
+
+_FORBIDDEN_RE = re.compile(
+    r"\b(?:i think|maybe|looks like|possibly|hope|bullish|bearish|should|could|might)\b",
+    re.IGNORECASE,
+)
+
+
+# Fixed phrasings for the post template, keyed by band / regime.
+_THRESHOLD_LINES = {
+    "critical": "critical — miners are in survival mode; block rewards are no longer enough to keep them solvent at current prices.",
+    "strained": "strained — miners are starting to lean on the market for exit liquidity.",
+    "amber": "amber — producers are drifting toward forced-seller territory.",
+}
+_THRESHOLD_DEFAULT = "below threshold — producers still trade like miners, not refugees."
+
+_IRQ_GLYPHS = {
+    "reversible": "🟦",
+    "primed": "🟧",
+    "irreversible": "🟥",
+    "floor": "⬛",
+}
+
+_REI_TRIGGERED = "🔻 triggered — the prior regime is collapsing; price is being routed through the chosen path"
+_REI_LINES = {
+    "dormant": "🔻 dormant — tension can still bleed without forcing a regime change",
+    "charged": "🔻 charged — the coil is loaded for resolution, but path and timing remain open",
+    "imminent": "🔻 imminent — incentives are forcing a regime choice; only a narrow cone of outcomes remains",
+}
+
+_TRANSLATIONS = {
+    "COMPRESSION": "Volatility is not optional. Custody compression forces timing irrelevance.",
+    "STARVATION": "Float dying creates illegal downside. Supply obstruction enforces ascent.",
+    "ASCENT": "Structural pull upward. Disappearing float guarantees price obedience.",
+    "DISTRIBUTION": "Temporary relief. Exit liquidity decays trajectory."
+}
+_TRANSLATION_DEFAULT = "Regime defines constraints. Price obeys inevitability."
+
+
+_INCENTIVE_CONFLICT_LINE = "⚠ Incentive Conflict: market is fighting chain-level incentives."
+
+# Body of the daily post; generate_post_text fills every placeholder.
+_POST_TPL = string.Template("""The ChainWalk Desk — Regime Scoreboard
+
+Bitcoin is not trading.
+It is trapped inside a macro regime.
+
+Today’s State
+• Regime: $regime
+• Chain Tension Index: $cti_str/10
+• Custody Vector: $custody_vector
+• Entropy Flux: $entropy_gradient
+• Price Corridor: $legality_floor
+• Outcome: $outcome_line
+• Intent: $mempool_line
+• Intent Clock: $intent_clock_line
+• Regime Clock: $clock_line
+  • Incentive Delta: $incentive_label
+   • Miner Field: $threshold_line
+   • Miner Stress: $hashrate_stress_score / 10 ($hashrate_stress_band)
+     • $miner_line
+     • Irreversibility (IRQ): $irq_line
+     • Resolution Field (REI): $rei_line
+     • Custody Trapdoor: $trapdoor_label
+   $incentive_conflict_line
+
+ Constraint Stack:
+ CTI — chain tension (how tightly Bitcoin’s incentive coil is compressed)
+ MTI — miner threshold (how much stress producers can absorb before leaning on price)
+ IRQ — irreversibility (how much optionality has been eliminated; unwind no longer benign)
+ REI — resolution field (how close the system is to forcing a regime outcome)
+
+ UQI — permissive futures remaining (🟢 open → ⚫ terminal)
+
+ Oracle Input Fingerprint
+ Fingerprints the incentive stack only — no price inputs. ($short_oih)
+
+ Translation:
+$translation
+
+Price does not lead the chain.
+The chain leads price.
+The oracle leads time.
+⬢
+
+As of $date UTC · Regime $regime_label
+
+#Bitcoin #ChainWalk #OnChainTruth
+""")
+
+
+def _describe_miner_cohort(tilt: str, dominant_pool: str) -> str:
+    tilt = (tilt or "neutral").lower()
+    pool = (dominant_pool or "UNKNOWN").upper()
+
+    if tilt == "coil_enforced":
+        if pool == "UNKNOWN":
+            return (
+                "Miner Cohort: today’s coil was enforced by a distributed set of pools — no single miner stepped in as reliever."
+            )
+        else:
+            return (
+                f"Miner Cohort: today’s coil was enforced primarily by {pool} — their blocks preserved compression instead of easing it."
+            )
+    elif tilt == "reliever":
+        if pool == "UNKNOWN":
+            return (
+                "Miner Cohort: mild reliever profile — block production slightly eased tension with no dominant pool."
+            )
+        else:
+            return (
+                f"Miner Cohort: reliever tilt led by {pool} — their blocks acted as a partial pressure valve today."
+            )
+    else:
+        # neutral or anything else
+        if pool == "UNKNOWN":
+            return "Miner Cohort: neutral — no clear enforcement or relief emerged from today’s pool mix."
+        else:
+            return f"Miner Cohort: neutral — {pool} was active but did not materially tilt the coil."
+
 
 def generate_post_text(state: dict, regime_snapshot) -> str:
     # Enforce language rules
-    forbidden = ["I think", "maybe", "looks like", "possibly", "hope", "bullish", "bearish", "should", "could", "might"]
-    outcome = state.get("outcome_line", "").lower()
-    if any(word in outcome for word in forbidden):
+    if _FORBIDDEN_RE.search(state.get("outcome_line", "")):
         raise ValueError("Forbidden language in post outcome")
 
     # Format CTI
     cti_val = float(state["cti"])
     cti_str = f"{cti_val:.1f}"
 
-    # Load clock line
-    from pathlib import Path
-    clock_path = Path("reports") / "regime_clock_state.json"
-    clock_line = None
-    if clock_path.exists():
-        try:
-            with clock_path.open("r", encoding="utf-8") as f:
-                clock_line = json.load(f).get("clock_line")
-        except Exception:
-            clock_line = None
+    bundle = _load_state_bundle(ROOT / "reports")
+
+    # Clock line
+    clock_line = bundle.get("regime_clock_state.json", {}).get("clock_line")
     if not clock_line:
         clock_line = "Regime Clock unavailable."
 
-    # Load mempool line
-    mempool_path = Path("reports") / "mempool_intent_state.json"
-    mempool_line = None
-    if mempool_path.exists():
-        try:
-            with mempool_path.open("r", encoding="utf-8") as f:
-                mempool_line = json.load(f).get("line")
-        except Exception:
-            mempool_line = None
+    # Mempool line
+    mempool_line = bundle.get("mempool_intent_state.json", {}).get("line")
     if not mempool_line:
         mempool_line = "Mempool intent unavailable — chain permission cannot be inferred today."
 
-    # Load intent clock line
-    intent_clock_path = Path("reports") / "intent_clock_state.json"
-    intent_clock_line = None
-    if intent_clock_path.exists():
-        try:
-            ic_state = json.load(intent_clock_path.open("r", encoding="utf-8"))
-            intent_clock_line = ic_state.get("clock_line")
-            # Gate wording for collapse window open
-            intent_state = ic_state.get("intent_state", "")
-            max_days = ic_state.get("max_days_remaining", 1)
-            if intent_state in {"BLEEDING", "EXHAUSTED"} and max_days == 0:
-                intent_clock_line = "desire has expired — the collapse window is now open."
-        except Exception:
-            intent_clock_line = None
+    # Intent clock line
+    ic_state = bundle.get("intent_clock_state.json", {})
+    intent_clock_line = ic_state.get("clock_line")
+    # Gate wording for collapse window open
+    intent_state = ic_state.get("intent_state", "")
+    max_days = ic_state.get("max_days_remaining", 1)
+    if intent_state in {"BLEEDING", "EXHAUSTED"} and max_days == 0:
+        intent_clock_line = "desire has expired — the collapse window is now open."
     if not intent_clock_line:
         intent_clock_line = "Intent Clock unavailable."
 
     # Miner threshold line
     miner_threshold = state.get('miner_threshold', {})
     th_band = miner_threshold.get("band", "below")
-    if th_band == "critical":
-        threshold_line = "critical — miners are in survival mode; block rewards are no longer enough to keep them solvent at current prices."
-    elif th_band == "strained":
-        threshold_line = "strained — miners are starting to lean on the market for exit liquidity."
-    elif th_band == "amber":
-        threshold_line = "amber — producers are drifting toward forced-seller territory."
-    else:
-        threshold_line = "below threshold — producers still trade like miners, not refugees."
+    threshold_line = _THRESHOLD_LINES.get(th_band, _THRESHOLD_DEFAULT)
 
     # Miner cohort line
     miner_cohort_state = state.get('miner_cohort', {})
     tilt = miner_cohort_state.get("tilt_label", "neutral")
     dominant_pool = miner_cohort_state.get("dominant_pool", "UNKNOWN")
 
-    def describe_miner_cohort(tilt: str, dominant_pool: str) -> str:
-        tilt = (tilt or "neutral").lower()
-        pool = (dominant_pool or "UNKNOWN").upper()
-
-        if tilt == "coil_enforced":
-            if pool == "UNKNOWN":
-                return (
-                    "Miner Cohort: today’s coil was enforced by a distributed set of pools — no single miner stepped in as reliever."
-                )
-            else:
-                return (
-                    f"Miner Cohort: today’s coil was enforced primarily by {pool} — their blocks preserved compression instead of easing it."
-                )
-        elif tilt == "reliever":
-            if pool == "UNKNOWN":
-                return (
-                    "Miner Cohort: mild reliever profile — block production slightly eased tension with no dominant pool."
-                )
-            else:
-                return (
-                    f"Miner Cohort: reliever tilt led by {pool} — their blocks acted as a partial pressure valve today."
-                )
-        else:
-            # neutral or anything else
-            if pool == "UNKNOWN":
-                return "Miner Cohort: neutral — no clear enforcement or relief emerged from today’s pool mix."
-            else:
-                return f"Miner Cohort: neutral — {pool} was active but did not materially tilt the coil."
-
-    miner_line = describe_miner_cohort(tilt, dominant_pool)
+    miner_line = _describe_miner_cohort(tilt, dominant_pool)
 
     # Irreversibility line
     irq_state = state.get('irreversibility', {})
     band = irq_state.get("band", "reversible")
     index = irq_state.get("index", 0.0)
-    glyph_map = {
-        "reversible": "🟦",
-        "primed": "🟧",
-        "irreversible": "🟥",
-        "floor": "⬛",
-    }
-    glyph = glyph_map.get(band, "🟦")
+    glyph = _IRQ_GLYPHS.get(band, "🟦")
     if band == "floor":
         irq_line = f"{glyph} protocol floor — price is downstream; exits sealed (IRQ {index:.2f})"
     else:
@@ -809,78 +1170,87 @@ def generate_post_text(state: dict, regime_snapshot) -> str:
     res = state.get('resolution', {})
     rei_band = res.get("band", "dormant")
     rei_index = res.get("index", 0.0)
-    if rei_band == "dormant":
-        rei_line = f"🔻 dormant — tension can still bleed without forcing a regime change"
-    elif rei_band == "charged":
-        rei_line = f"🔻 charged — the coil is loaded for resolution, but path and timing remain open"
-    elif rei_band == "imminent":
-        rei_line = f"🔻 imminent — incentives are forcing a regime choice; only a narrow cone of outcomes remains"
-    else:
-        rei_line = f"🔻 triggered — the prior regime is collapsing; price is being routed through the chosen path"
-    rei_line += f" (REI {rei_index:.2f})"
+    rei_line = f"{_REI_LINES.get(rei_band, _REI_TRIGGERED)} (REI {rei_index:.2f})"
 
     # Translation based on regime
-    translations = {
-        "COMPRESSION": "Volatility is not optional. Custody compression forces timing irrelevance.",
-        "STARVATION": "Float dying creates illegal downside. Supply obstruction enforces ascent.",
-        "ASCENT": "Structural pull upward. Disappearing float guarantees price obedience.",
-        "DISTRIBUTION": "Temporary relief. Exit liquidity decays trajectory."
-    }
-    translation = translations.get(regime_snapshot.name, "Regime defines constraints. Price obeys inevitability.")
-
-    oih = state.get("oracle_input_hash")
-    short_oih = oih[-8:] if isinstance(oih, str) and len(oih) >= 8 else "N/A"
-
-    post = f"""The ChainWalk Desk — Regime Scoreboard
-
-Bitcoin is not trading.
-It is trapped inside a macro regime.
-
-Today’s State
-• Regime: {regime_snapshot.name}
-• Chain Tension Index: {cti_str}/10
-• Custody Vector: {state['custody_vector']}
-• Entropy Flux: {state['entropy_gradient']}
-• Price Corridor: {state['legality_floor']}
-• Outcome: {state['outcome_line']}
-• Intent: {mempool_line}
-• Intent Clock: {intent_clock_line}
-• Regime Clock: {clock_line}
-  • Incentive Delta: {state['incentive_label']}
-   • Miner Field: {threshold_line}
-   • Miner Stress: {state['hashrate_stress_score']:.1f} / 10 ({state['hashrate_stress_band']})
-     • {miner_line}
-     • Irreversibility (IRQ): {irq_line}
-     • Resolution Field (REI): {rei_line}
-     • Custody Trapdoor: {state['trapdoor'].get('label', '')}
-   {"⚠ Incentive Conflict: market is fighting chain-level incentives." if state.get('incentive_conflict') else ""}
-
- Constraint Stack:
- CTI — chain tension (how tightly Bitcoin’s incentive coil is compressed)
- MTI — miner threshold (how much stress producers can absorb before leaning on price)
- IRQ — irreversibility (how much optionality has been eliminated; unwind no longer benign)
- REI — resolution field (how close the system is to forcing a regime outcome)
-
- UQI — permissive futures remaining (🟢 open → ⚫ terminal)
-
- Oracle Input Fingerprint
- Fingerprints the incentive stack only — no price inputs. ({short_oih})
-
- Translation:
-{translation}
-
-Price does not lead the chain.
-The chain leads price.
-The oracle leads time.
-⬢
-
-As of {state['date']} UTC · Regime {state['regime_label']}
-
-#Bitcoin #ChainWalk #OnChainTruth
-"""
-    return post
+    translation = _TRANSLATIONS.get(regime_snapshot.name, _TRANSLATION_DEFAULT)
+
+    short_oih = safe_str_tail(state.get("oracle_input_hash"))
+
+    return _POST_TPL.substitute(
+        regime=regime_snapshot.name,
+        cti_str=cti_str,
+        custody_vector=state['custody_vector'],
+        entropy_gradient=state['entropy_gradient'],
+        legality_floor=state['legality_floor'],
+        outcome_line=state['outcome_line'],
+        mempool_line=mempool_line,
+        intent_clock_line=intent_clock_line,
+        clock_line=clock_line,
+        incentive_label=state['incentive_label'],
+        threshold_line=threshold_line,
+        hashrate_stress_score=f"{state['hashrate_stress_score']:.1f}",
+        hashrate_stress_band=state['hashrate_stress_band'],
+        miner_line=miner_line,
+        irq_line=irq_line,
+        rei_line=rei_line,
+        trapdoor_label=state['trapdoor'].get('label', ''),
+        incentive_conflict_line=_INCENTIVE_CONFLICT_LINE if state.get('incentive_conflict') else "",
+        short_oih=short_oih,
+        translation=translation,
+        date=state['date'],
+        regime_label=state['regime_label'],
+    )
 
-def save_state(reports_dir: Path, snapshot: ChainTensionSnapshot, date_str: str) -> None:
+@dataclass(slots=True)
+class DailyState:
+    """
+    Final shape of reports/chainwalk_daily_state.json. Field order is the
+    key order on disk; the measurement fields feed the oracle fingerprint.
+    """
+    date_utc: str
+    chain_tension_index: float
+    regime_label: str
+    custody_direction: str
+    price_usd: float
+    drivers: Dict[str, Any]
+    incentive_delta: float
+    trapdoor: Dict[str, Any]
+    price_corridor: str
+    hashrate: Dict[str, Any]
+    miner_threshold: Dict[str, Any]
+    irreversibility: Dict[str, Any]
+    resolution: Dict[str, Any]
+    uncertainty: Dict[str, Any]
+    regime_integrity: str
+
+    # Measurement fields for the oracle fingerprint
+    regime_phase: str
+    entropy_band: str
+    mempool_intent_band: str
+    mempool_intent_score: float
+    hashrate_band: str
+    hashrate_stress: float
+    mti_index: float
+    mti_band: str
+    eti_index: float
+    eti_band: str
+    irq_index: float
+    irq_band: str
+    rei_index: float
+    rei_band: str
+
+    oracle_input_hash: str = ""
+    difficulty_epoch: Dict[str, Any] = field(default_factory=dict)
+    miner_cohort: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        # Shallow on purpose: the nested dicts are already plain JSON values,
+        # so asdict()'s deep copy would only duplicate them.
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+def save_state(reports_dir: Path, snapshot: "ChainTensionSnapshot", date_str: str) -> None:
     state_path = reports_dir / "chainwalk_daily_state.json"
     state = {
         "date_utc": date_str,
@@ -888,16 +1258,54 @@ def save_state(reports_dir: Path, snapshot: ChainTensionSnapshot, date_str: str)
         "regime_label": snapshot.regime_label,
         "drivers": snapshot.drivers
     }
-    with open(state_path, "w", encoding="utf-8") as f:
-        json.dump(state, f, indent=2)
+    _write_json(state_path, state)
 
 def main() -> None:
+    # The engine modules are only needed for the full daily run; importing
+    # them here keeps the stats/report helpers cheap to import on their own.
+    from core.regime_metrics import compute_snapshot, ChainTensionSnapshot
+    from core.brief_renderer import render_apex_brief
+    from utils.memory_of_price import update_memory_state, MemorySnapshot
+    from utils.price_corridor_engine import compute_corridor
+    from renderers.price_corridor_renderer import render_price_corridor
+    from utils.regime_tracker import classify_regime
+    from renderers.regime_renderer import render_regime_section
+    from utils.scoreboard_loader import load_scoreboard_state
+    from utils.wavefunction import scores_to_wavefunction
+    from utils.regime_hamiltonian import compute_regime_horizon, REGIME_BASIS
+    from utils.regime_clock import compute_regime_clock, regime_clock_to_json
+    from utils.intent_clock import compute_intent_clock, intent_clock_to_json
+    from utils.incentive import compute_drivers, compute_incentive_delta, has_incentive_conflict
+    from utils.trapdoor import compute_trapdoor
+    from utils.spine import build_spine_line
+    from utils.mempool_intent import (
+        compute_mempool_intent,
+        mempool_intent_to_json,
+    )
+    from utils.apex_deck import build_apex_deck
+    from utils.hashrate_oracle import HashrateInputs, hashrate_to_json
+    from utils.miner_threshold import compute_miner_threshold, to_state_dict
+    from utils.outcome_engine import append_outcome_snapshot
+    from utils.difficulty_epoch import compute_epoch_tension, save_difficulty_epoch_state
+    from utils.miner_cohorts import compute_miner_cohort_tilt, save_miner_cohort_tilt
+    from utils.irreversibility_engine import compute_irq
+    from utils.resolution_engine import compute_resolution_index
+    from utils.uncertainty_engine import compute_uqi
+    from utils import alert_rail
+    from utils.oracle_fingerprint import compute_oracle_input_hash
+    from ui.scorecard import render_scorecard
+
+    # One clock reading for the whole run so every artefact agrees on the date.
+    now = datetime.now(timezone.utc)
+    date_str = now.strftime("%Y-%m-%d")
+
     latest_path = ROOT / "sovereign_signals_latest.json"
     reports_dir = ROOT / "reports"
     reports_dir.mkdir(exist_ok=True)
 
     print(f"[daily_brief] Loading latest signals from: {latest_path}")
-    data = load_latest_signals(latest_path)
+    # Only the trailing window is analysed, so don't keep the rest around.
+    data = load_latest_signals(latest_path, limit=500)
     signals = data.get("signals", [])
     if not signals:
         print("[daily_brief] No signals found; exiting.")
@@ -907,9 +1315,16 @@ def main() -> None:
     entropy_script = ROOT / "run_entropy_flux.py"
     if entropy_script.exists():
         print("[daily_brief] Running entropy flux analysis...")
+        # Run the script in this interpreter rather than spawning a new one;
+        # run_name="__main__" keeps its entry-point guard firing as before.
         try:
-            subprocess.run([sys.executable, str(entropy_script)], check=False)
+            runpy.run_path(str(entropy_script), run_name="__main__")
             print("[daily_brief] Entropy analysis completed.")
+        except SystemExit as e:
+            if e.code not in (None, 0):
+                print(f"[daily_brief] Entropy analysis exited with status {e.code}")
+            else:
+                print("[daily_brief] Entropy analysis completed.")
         except Exception as e:
             print(f"[daily_brief] Entropy analysis failed: {e}")
     else:
@@ -919,14 +1334,15 @@ def main() -> None:
     # For simplicity, last 500
     window_signals = signals[-500:] if len(signals) >= 500 else signals
 
-    heights = [int(s.get("height", 0)) for s in window_signals]
-    window_min_height = min(heights) if heights else 0
-    window_max_height = max(heights) if heights else 0
+    totals = _window_totals(window_signals)
+    window_min_height = int(totals.height_min)
+    window_max_height = int(totals.height_max)
 
     print(f"[daily_brief] Selected {len(window_signals)} signals for analysis (heights {window_min_height} to {window_max_height})")
 
     # Load previous snapshot
     prev_data = load_previous_snapshot(reports_dir)
+    prev_chainwalk_daily_state = prev_data or {}
     previous_snapshot = None
     if prev_data:
         # Reconstruct ChainTensionSnapshot from dict
@@ -950,7 +1366,7 @@ def main() -> None:
 
     # Update memory of price
     custody_direction = "vaultward" if snapshot.drivers.get("custody", 0) > 0.5 else "marketward"
-    entropy_mean = sum(s.get("entropy", 0) for s in window_signals) / len(window_signals) if window_signals else 0
+    entropy_mean = totals.entropy / totals.count
     entropy_gradient_7d = 0.0  # placeholder, could compute from history
     miner_fee_bias = "rising" if snapshot.avg_fee_pressure > 0.5 else "flat" if snapshot.avg_fee_pressure > 0.2 else "falling"
     entropy_stats = {"mean": entropy_mean, "gradient_7d": entropy_gradient_7d}
@@ -972,16 +1388,11 @@ def main() -> None:
     corridor = compute_corridor(memory_state, custody_state, entropy_state)
     print(f"[daily_brief] Price Corridor computed: {corridor.legality_floor} floor, {corridor.inevitability}")
 
-    # Get current time
-    now = datetime.now(timezone.utc)
-    date_str = now.strftime("%Y-%m-%d")
-
     # Load network snapshot for hashrate oracle
     network_snapshot_path = reports_dir / "network_snapshot.json"
     hashrate_state = {}
-    if network_snapshot_path.exists():
-        with network_snapshot_path.open("r", encoding="utf-8") as f:
-            net = json.load(f)
+    net = _load_json(network_snapshot_path)
+    if net is not None:
         hr_inputs = HashrateInputs(
             hashrate_eh=float(net["hashrate_eh"]),
             hashrate_eh_prev=float(net.get("hashrate_eh_prev", net["hashrate_eh"])),
@@ -1005,49 +1416,84 @@ def main() -> None:
         }
 
     # Write hashrate_state out for other readers
-    with (reports_dir / "hashrate_state.json").open("w", encoding="utf-8") as f:
-        json.dump(hashrate_state, f, ensure_ascii=False, indent=2)
-
-    # Classify regime
-    regime_snapshot = classify_regime(memory_snapshot, corridor)
-    print(f"[daily_brief] Regime classified: {regime_snapshot.name} — {regime_snapshot.inevitability}")
-
-    # Compute Miner Threshold Index
-    # Load intent_clock_state for collapse_window_open
-    intent_clock_path = reports_dir / "intent_clock_state.json"
-    collapse_window_open = False
-    if intent_clock_path.exists():
-        with intent_clock_path.open("r", encoding="utf-8") as f:
-            intent_state = json.load(f)
-        collapse_window_open = intent_state.get("max_days_remaining", 0) == 0
-
-    mt_result = compute_miner_threshold(
-        cti=snapshot.chain_tension_index,
-        regime_label=regime_snapshot.name,
-        stress_score=hashrate_state.get("stress_score", 0.0),
-        collapse_window_open=collapse_window_open,
-    )
+    _write_json(reports_dir / "hashrate_state.json", hashrate_state)
+
+    # Difficulty-epoch tension and the block-catalog scan for the miner cohort
+    # depend only on the window, so they run alongside regime classification
+    # and the miner threshold. State files are still saved in the old order.
+    block_catalog_path = ROOT / "block_catalog.jsonl"
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        epoch_future = ex.submit(compute_epoch_tension, net, date_utc=date_str)
+        cohort_future = ex.submit(
+            compute_miner_cohort_tilt,
+            date_utc=date_str,
+            block_catalog_path=block_catalog_path,
+            window_range=(window_min_height, window_max_height),
+        )
+
+        # Classify regime
+        regime_snapshot = classify_regime(memory_snapshot, corridor)
+        print(f"[daily_brief] Regime classified: {regime_snapshot.name} — {regime_snapshot.inevitability}")
+
+        # Compute Miner Threshold Index
+        # Load intent_clock_state for collapse_window_open
+        intent_clock_path = reports_dir / "intent_clock_state.json"
+        collapse_window_open = False
+        intent_state = _load_json(intent_clock_path)
+        if intent_state is not None:
+            collapse_window_open = intent_state.get("max_days_remaining", 0) == 0
+
+        mt_result = compute_miner_threshold(
+            cti=snapshot.chain_tension_index,
+            regime_label=regime_snapshot.name,
+            stress_score=hashrate_state.get("stress_score", 0.0),
+            collapse_window_open=collapse_window_open,
+        )
 
-    # Write miner_threshold_state.json
-    with (reports_dir / "miner_threshold_state.json").open("w", encoding="utf-8") as f:
-        json.dump(to_state_dict(mt_result), f, indent=2)
+        # Write miner_threshold_state.json
+        _write_json(reports_dir / "miner_threshold_state.json", to_state_dict(mt_result))
 
-    # Compute difficulty epoch tension
-    epoch_state = compute_epoch_tension(net, date_utc=date_str)
+        epoch_state = epoch_future.result()
+        cohort_tilt = cohort_future.result()
+
+    # Save difficulty epoch tension
     difficulty_epoch_state = save_difficulty_epoch_state(reports_dir, epoch_state)
 
-    # Compute miner cohort tilt
-    block_catalog_path = ROOT / "block_catalog.jsonl"
-    window_heights = range(window_min_height, window_max_height + 1)
-    cohort_tilt = compute_miner_cohort_tilt(
-        date_utc=date_str,
-        block_catalog_path=block_catalog_path,
-        window_heights=window_heights,
-    )
+    # Save miner cohort tilt
     miner_cohort_state = {}
     if cohort_tilt is not None:
         miner_cohort_state = save_miner_cohort_tilt(reports_dir, cohort_tilt)
 
+    # Compute and save Mempool Intent. This runs before IRQ/REI so both see
+    # today's intent state instead of falling back to UNKNOWN.
+    today_state = "UNKNOWN"
+    mempool_state = {}
+    try:
+        tx_now, tx_then = load_mempool_counts()
+
+        mempool_state = compute_mempool_intent(
+            date_utc=date_str,
+            tx_count_now=tx_now,
+            tx_count_then=tx_then,
+        )
+
+        mempool_json = mempool_intent_to_json(mempool_state)
+
+        mempool_path = reports_dir / "mempool_intent_state.json"
+        _write_json(mempool_path, mempool_json)
+
+        print(f"[daily_brief] Mempool Intent: {mempool_json.get('line')}")
+
+        today_state = mempool_state.state
+
+    except Exception as e:
+        print(f"[mempool_intent] Failed to compute mempool intent: {e}")
+        # Still proceed, as it's not critical
+
+    # Today's intent clock is only computed further down; IRQ/REI run
+    # without it, as before.
+    intent_clock: Dict[str, Any] = {}
+
     # Compute Irreversibility
     irq_state = {
         "cti": snapshot.chain_tension_index,
@@ -1055,19 +1501,18 @@ def main() -> None:
         "eti": epoch_state.tension_index,
         "custody_streak": memory_snapshot.custody_streak,
         "regime": regime_snapshot.name,
-        "intent_state": mempool_state.get("state", "UNKNOWN") if 'mempool_state' in locals() else "UNKNOWN",
+        "intent_state": today_state,
     }
     irq_result = compute_irq(irq_state)
     print(f"[daily_brief] Irreversibility: {irq_result.band} (IRQ {irq_result.index:.2f})")
 
     # Save to reports/irreversibility_state.json
-    with (reports_dir / "irreversibility_state.json").open("w", encoding="utf-8") as f:
-        json.dump({
-            "date_utc": date_str,
-            "band": irq_result.band,
-            "index": irq_result.index,
-            "details": irq_result.details,
-        }, f, indent=2)
+    _write_json(reports_dir / "irreversibility_state.json", {
+        "date_utc": date_str,
+        "band": irq_result.band,
+        "index": irq_result.index,
+        "details": irq_result.details,
+    })
 
     # Compute Resolution
     rei = compute_resolution_index(
@@ -1077,8 +1522,8 @@ def main() -> None:
         miner_threshold_index=mt_result.index,
         epoch_tension_index=epoch_state.tension_index,
         irreversibility_index=irq_result.index,
-        mempool_intent_state=mempool_state.get("state", "UNKNOWN") if 'mempool_state' in locals() else "UNKNOWN",
-        intent_days_remaining=intent_clock.get("max_days_remaining", 0) if 'intent_clock' in locals() else 0,
+        mempool_intent_state=today_state,
+        intent_days_remaining=intent_clock.get("max_days_remaining", 0),
     )
     print(f"[daily_brief] Resolution: {rei.band} (REI {rei.index:.2f})")
 
@@ -1095,13 +1540,12 @@ def main() -> None:
     print(f"[daily_brief] Uncertainty: {uqi.band} (UQI {uqi.index:.2f})")
 
     # Save to reports/resolution_state.json
-    with (reports_dir / "resolution_state.json").open("w", encoding="utf-8") as f:
-        json.dump({
-            "date_utc": date_str,
-            "band": rei.band,
-            "index": round(rei.index, 4),
-            "details": rei.details,
-        }, f, indent=2)
+    _write_json(reports_dir / "resolution_state.json", {
+        "date_utc": date_str,
+        "band": rei.band,
+        "index": round(rei.index, 4),
+        "details": rei.details,
+    })
 
     # Define regime_label and streak_days for clock computation
     regime_label = regime_snapshot.name
@@ -1109,16 +1553,14 @@ def main() -> None:
 
     # Compute wavefunction
     probs, amps = scores_to_wavefunction(regime_snapshot.scores)
-    dominant_state = max(probs.items(), key=lambda kv: kv[1])[0]
+    dominant_state = max(probs.items(), key=itemgetter(1))[0]
     INDEX = {"S": -2.0, "C": -1.0, "D": 1.0, "A": 2.0}
     expectation = sum(INDEX[k] * probs[k] for k in INDEX)
     print(f"[daily_brief] Wavefunction: dominant {dominant_state}, expectation {expectation:.2f}")
 
     # Log to regime_wavefunction.jsonl
-    from pathlib import Path
-    path = Path("reports") / "regime_wavefunction.jsonl"
-    path.parent.mkdir(parents=True, exist_ok=True)
-    today_iso = now.strftime("%Y-%m-%d")
+    path = reports_dir / "regime_wavefunction.jsonl"
+    today_iso = date_str
     run_timestamp = now.isoformat()
     # Gather context
     cti_value = snapshot.chain_tension_index
@@ -1128,7 +1570,7 @@ def main() -> None:
     entropy_gradient = regime_snapshot.entropy
     legality_floor = regime_snapshot.corridor
     corridor_status = legality_floor  # placeholder
-    tip_height = max(s.get("height", 0) for s in window_signals) if window_signals else 0
+    tip_height = totals.height_max
     tip_hash = "unknown"  # placeholder
     regime_name = regime_snapshot.name
 
@@ -1161,54 +1603,24 @@ def main() -> None:
         "version": "wavefunction-v1",
     }
 
-    with path.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(record) + "\n")
+    append_wavefunction((record,), path)
     print(f"[daily_brief] Wavefunction logged to {path}")
 
     # Compute regime horizon
     ham_state = compute_regime_horizon(
         horizon_days=7,
-        regime_state_path="reports/regime_state.json",
-        wavefunction_path="reports/regime_wavefunction.jsonl",
-        out_state_path="reports/regime_hamiltonian_state.json",
+        regime_state_path=str(reports_dir / "regime_state.json"),
+        wavefunction_path=str(reports_dir / "regime_wavefunction.jsonl"),
+        out_state_path=str(reports_dir / "regime_hamiltonian_state.json"),
     )
     horizon_line = format_regime_horizon_line(ham_state)
     print(f"[daily_brief] Regime Horizon (7d): {horizon_line}")
 
-    # Compute and save Mempool Intent
-    today_state = "UNKNOWN"
-    mempool_state = {}
-    try:
-        tx_now, tx_then = load_mempool_counts()
-
-        mempool_state = compute_mempool_intent(
-            date_utc=date_str,
-            tx_count_now=tx_now,
-            tx_count_then=tx_then,
-        )
-
-        mempool_json = mempool_intent_to_json(mempool_state)
-
-        mempool_path = reports_dir / "mempool_intent_state.json"
-        with mempool_path.open("w", encoding="utf-8") as f:
-            json.dump(mempool_json, f, ensure_ascii=False, indent=2)
-
-        print(f"[daily_brief] Mempool Intent: {mempool_json.get('line')}")
-
-        today_state = mempool_state.state
-
-    except Exception as e:
-        print(f"[mempool_intent] Failed to compute mempool intent: {e}")
-        # Still proceed, as it's not critical
-
     # Compute and save Intent Clock
     try:
         # Load previous intent clock state
-        prev_intent_clock = None
         intent_clock_path = reports_dir / "intent_clock_state.json"
-        if intent_clock_path.exists():
-            with intent_clock_path.open("r", encoding="utf-8") as f:
-                prev_intent_clock = json.load(f)
+        prev_intent_clock = _load_json(intent_clock_path)
 
         # Today's state
         today_state = mempool_state.state
@@ -1222,8 +1634,7 @@ def main() -> None:
         )
 
         # Save to reports/intent_clock_state.json
-        with intent_clock_path.open("w", encoding="utf-8") as f:
-            json.dump(intent_clock_state, f, ensure_ascii=False, indent=2)
+        _write_json(intent_clock_path, intent_clock_state)
 
         print(f"[daily_brief] Intent Clock: {intent_clock_state.get('clock_line')}")
 
@@ -1235,21 +1646,12 @@ def main() -> None:
     clock_line = None
     regime_clock_state = {}
     try:
-        # Load chainwalk_daily_state
-        chainwalk_daily_state_path = reports_dir / "chainwalk_daily_state.json"
-        if chainwalk_daily_state_path.exists():
-            with chainwalk_daily_state_path.open("r", encoding="utf-8") as f:
-                chainwalk_daily_state = json.load(f)
-            date_utc = chainwalk_daily_state.get("date_utc", datetime.now(timezone.utc).date().isoformat())
-        else:
-            chainwalk_daily_state = {}
-            date_utc = datetime.now(timezone.utc).date().isoformat()
+        date_utc = date_str
 
         # Load regime_state for correct streak
         regime_state_path = reports_dir / "regime_state.json"
-        if regime_state_path.exists():
-            with regime_state_path.open("r", encoding="utf-8") as f:
-                regime_state = json.load(f)
+        regime_state = _load_json(regime_state_path)
+        if regime_state is not None:
             regime_label = regime_state["dominant_vector"]
             streak_days = regime_state["current_streak"]
         else:
@@ -1268,8 +1670,7 @@ def main() -> None:
 
         # Save to reports/regime_clock_state.json
         clock_path = reports_dir / "regime_clock_state.json"
-        with clock_path.open("w", encoding="utf-8") as f:
-            json.dump(clock_json, f, ensure_ascii=False, indent=2)
+        _write_json(clock_path, clock_json)
 
         regime_clock_state = clock_json
         clock_line = clock_json.get("clock_line")
@@ -1280,29 +1681,26 @@ def main() -> None:
         # Still proceed, as it's not critical
 
     # Load memory and mempool states for drivers
-    memory_loaded = {}
-    mempool_loaded = {}
-    if (reports_dir / "memory_of_price_state.json").exists():
-        with (reports_dir / "memory_of_price_state.json").open("r", encoding="utf-8") as f:
-            memory_loaded = json.load(f)
-    if (reports_dir / "mempool_intent_state.json").exists():
-        with (reports_dir / "mempool_intent_state.json").open("r", encoding="utf-8") as f:
-            mempool_loaded = json.load(f)
+    memory_loaded = _load_json(reports_dir / "memory_of_price_state.json", {})
+    mempool_loaded = _load_json(reports_dir / "mempool_intent_state.json", {})
 
     # Build and save the daily brief markdown
+    # The window is never empty here (main() returns early without signals),
+    # so the totals gathered up front can be used directly.
+    n = totals.count
     stats = BriefStats(
-        block_count=len(window_signals),
-        height_min=min(s.get("height", 0) for s in window_signals) if window_signals else 0,
-        height_max=max(s.get("height", 0) for s in window_signals) if window_signals else 0,
-        t_start=min(s.get("timestamp", 0) for s in window_signals) if window_signals else None,
-        t_end=max(s.get("timestamp", 0) for s in window_signals) if window_signals else None,
-        total_txs=sum(s.get("tx_count", 0) for s in window_signals),
-        avg_txs_per_block=sum(s.get("tx_count", 0) for s in window_signals) / len(window_signals) if window_signals else 0,
-        total_out_btc=sum(s.get("total_output_btc", 0) for s in window_signals),
-        total_fees_btc=sum(s.get("total_fee_btc", 0) for s in window_signals),
-        avg_fees_per_block=sum(s.get("total_fee_btc", 0) for s in window_signals) / len(window_signals) if window_signals else 0,
-        avg_entropy=sum(s.get("entropy", 0) for s in window_signals) / len(window_signals) if window_signals else 0,
-        avg_complexity=sum(s.get("compression_ratio", 0) for s in window_signals) / len(window_signals) if window_signals else 0,
+        block_count=n,
+        height_min=totals.height_min,
+        height_max=totals.height_max,
+        t_start=totals.ts_min,
+        t_end=totals.ts_max,
+        total_txs=totals.tx_count,
+        avg_txs_per_block=totals.tx_count / n,
+        total_out_btc=totals.total_output_btc,
+        total_fees_btc=totals.total_fee_btc,
+        avg_fees_per_block=totals.total_fee_btc / n,
+        avg_entropy=totals.entropy / n,
+        avg_complexity=totals.compression_ratio / n,
     )
 
     facts = f"Analyzed {len(window_signals)} blocks from height {stats.height_min} to {stats.height_max}."
@@ -1318,7 +1716,15 @@ def main() -> None:
     # Compute drivers and incentive delta
     drivers = compute_drivers({"chain_tension_index": snapshot.chain_tension_index}, memory_loaded, mempool_loaded)
     incentive = compute_incentive_delta(drivers)
-    incentive_conflict = has_incentive_conflict(memory_state.get("custody_direction", ""), incentive["value"])
+
+    # Single source for values the scorecard, trapdoor and daily state share.
+    # A missing custody_direction fails the sanity assert below, so its
+    # fallback only matters for the scorecard, where it reads "neutral".
+    loaded_custody = memory_loaded.get("custody_direction", "neutral")
+    loaded_streak = int(memory_loaded.get("custody_streak", 0))
+    cti_value = float(snapshot.chain_tension_index)
+    incentive_conflict = has_incentive_conflict(loaded_custody, incentive["value"])
+    mt_state = to_state_dict(mt_result)
 
     # Build canonical scorecard state
     badges = {
@@ -1333,121 +1739,84 @@ def main() -> None:
         "regime_symbol": badges.get(regime_snapshot.name, "[UNKNOWN]"),
         "streak": int(regime_state.get("current_streak", 0)),
         "flips": int(regime_state.get("total_flips", 0)),
-        "cti": float(snapshot.chain_tension_index),
+        "cti": cti_value,
         "cti_label": "tension stored",
-        "custody_direction": memory_loaded.get("custody_direction", "neutral"),
-        "custody_streak": int(memory_loaded.get("custody_streak", 0)),
+        "custody_direction": loaded_custody,
+        "custody_streak": loaded_streak,
         "entropy_trend": memory_loaded.get("entropy_trend_7d", "flat"),
         "price_corridor": corridor.legality_floor,
         "outcome": regime_snapshot.inevitability,
-        "incentive_delta": float(chainwalk_daily_state.get("incentive_delta", 0.0)),
-        "trapdoor": chainwalk_daily_state.get("trapdoor", {}),
+        "incentive_delta": float(prev_chainwalk_daily_state.get("incentive_delta", 0.0)),
+        "trapdoor": prev_chainwalk_daily_state.get("trapdoor", {}),
         # For post generation
-        "cti": snapshot.chain_tension_index,
         "custody_vector": f"{custody_direction} (streak {memory_snapshot.custody_streak})",
         "entropy_gradient": regime_snapshot.entropy,
         "legality_floor": corridor.legality_floor,
         "outcome_line": regime_snapshot.inevitability,
         "incentive_label": incentive["label"],
-        "incentive_conflict": has_incentive_conflict(memory_loaded.get("custody_direction", ""), incentive["value"]),
+        "incentive_conflict": incentive_conflict,
         "hashrate_trend": hashrate_state.get("trend", "unknown"),
         "hashrate_stress_score": hashrate_state.get("stress_score", 0.0),
         "hashrate_stress_band": hashrate_state.get("stress_band", "calm"),
         "hashrate_label": hashrate_state.get("label", ""),
-        "miner_threshold": to_state_dict(mt_result),
-        "oracle_input_hash": chainwalk_daily_state.get("oracle_input_hash"),
+        "miner_threshold": mt_state,
+        "oracle_input_hash": prev_chainwalk_daily_state.get("oracle_input_hash"),
     }
 
     # Compute trapdoor
-    custody_streak = int(memory_loaded.get("custody_streak", 0))
-    cti_value = float(snapshot.chain_tension_index)
-    trapdoor_state = compute_trapdoor(custody_streak, cti_value)
+    trapdoor_state = compute_trapdoor(loaded_streak, cti_value)
 
     # Save to chainwalk_daily_state.json
-    chainwalk_daily_state = {
-        "date_utc": date_str,
-        "chain_tension_index": snapshot.chain_tension_index,
-        "regime_label": regime_snapshot.name,
-        "custody_direction": memory_loaded.get("custody_direction", "UNKNOWN"),
-        "price_usd": float(net.get("price_usd", 0.0)),
-        "drivers": drivers,
-        "incentive_delta": incentive["value"],
-        "trapdoor": trapdoor_state,
-        "price_corridor": corridor.legality_floor,
-        "hashrate": hashrate_state,
-        "miner_threshold": to_state_dict(mt_result),
-        "irreversibility": {
-            "band": irq_result.band,
-            "index": irq_result.index,
-        },
-        "resolution": {
-            "band": rei.band,
-            "index": rei.index,
-        },
-        "uncertainty": {
-            "band": uqi.band,
-            "index": uqi.index,
-        },
-        "regime_integrity": {
-            "label": "COILED" if trapdoor_state.get("band") in ("primed", "loaded") or to_state_dict(mt_result).get("band") in ("strained", "critical") else "RELAXED",
-            "custody_trapdoor": trapdoor_state.get("band", "latent"),
-            "miner_threshold": to_state_dict(mt_result).get("band", "below"),
-            "custody_direction": memory_loaded.get("custody_direction", "UNKNOWN")
-        },
-    }
+    coiled = (
+        trapdoor_state.get("band") in ("primed", "loaded")
+        or mt_state.get("band") in ("strained", "critical")
+    )
+    daily = DailyState(
+        date_utc=date_str,
+        chain_tension_index=snapshot.chain_tension_index,
+        regime_label=regime_snapshot.name,
+        custody_direction=loaded_custody,
+        price_usd=float(net.get("price_usd", 0.0)),
+        drivers=drivers,
+        incentive_delta=incentive["value"],
+        trapdoor=trapdoor_state,
+        price_corridor=corridor.legality_floor,
+        hashrate=hashrate_state,
+        miner_threshold=mt_state,
+        irreversibility={"band": irq_result.band, "index": irq_result.index, "date_utc": date_str},
+        resolution={"band": rei.band, "index": rei.index, "date_utc": date_str},
+        uncertainty={"band": uqi.band, "index": uqi.index, "date_utc": date_str},
+        regime_integrity="COILED" if coiled else "RELAXED",
+        regime_phase=regime_clock_state.get("phase", "MID"),
+        entropy_band=memory_loaded.get("entropy_trend_7d", "flat"),
+        mempool_intent_band=mempool_loaded.get("band", "neutral"),
+        mempool_intent_score=mempool_loaded.get("score", 0.0),
+        hashrate_band=hashrate_state.get("band", "calm"),
+        hashrate_stress=hashrate_state.get("stress_score", 0.0),
+        mti_index=mt_result.index,
+        mti_band=mt_result.band,
+        eti_index=epoch_state.tension_index,
+        eti_band="high" if epoch_state.tension_index > 1.0 else "normal",
+        irq_index=irq_result.index,
+        irq_band=irq_result.band,
+        rei_index=rei.index,
+        rei_band=rei.band,
+        difficulty_epoch=difficulty_epoch_state,
+        miner_cohort=miner_cohort_state,
+    )
 
     # Sanity invariants
-    assert isinstance(chainwalk_daily_state["chain_tension_index"], (int, float))
-    assert chainwalk_daily_state["price_corridor"] in {"permitted", "constrained", "forbidden"}
+    assert isinstance(daily.chain_tension_index, (int, float))
+    assert daily.price_corridor in {"permitted", "constrained", "forbidden"}
     assert memory_loaded["custody_direction"] in {"marketward", "vaultward", "neutral"}
 
-    # Add measurement fields for oracle fingerprint
-    chainwalk_daily_state["regime_phase"] = regime_clock_state.get("phase", "MID")
-    chainwalk_daily_state["entropy_band"] = memory_loaded.get("entropy_trend_7d", "flat")
-    chainwalk_daily_state["mempool_intent_band"] = mempool_loaded.get("band", "neutral")
-    chainwalk_daily_state["mempool_intent_score"] = mempool_loaded.get("score", 0.0)
-    chainwalk_daily_state["hashrate_band"] = hashrate_state.get("band", "calm")
-    chainwalk_daily_state["hashrate_stress"] = hashrate_state.get("stress_score", 0.0)
-    chainwalk_daily_state["mti_index"] = mt_result.index
-    chainwalk_daily_state["mti_band"] = mt_result.band
-    chainwalk_daily_state["eti_index"] = epoch_state.tension_index
-    chainwalk_daily_state["eti_band"] = "high" if epoch_state.tension_index > 1.0 else "normal"
-    chainwalk_daily_state["irq_index"] = irq_result.index
-    chainwalk_daily_state["irq_band"] = irq_result.band
-    chainwalk_daily_state["rei_index"] = rei.index
-    chainwalk_daily_state["rei_band"] = rei.band
-    ri = chainwalk_daily_state.get("regime_integrity", {})
-    if isinstance(ri, dict):
-        chainwalk_daily_state["regime_integrity"] = ri.get("label", "UNKNOWN")
-
-    # Compute oracle input hash
-    oracle_hash = compute_oracle_input_hash(chainwalk_daily_state)
-    chainwalk_daily_state["oracle_input_hash"] = oracle_hash
-    with (reports_dir / "chainwalk_daily_state.json").open("w", encoding="utf-8") as f:
-        json.dump(chainwalk_daily_state, f, ensure_ascii=False, indent=2)
-
-    # Embed new states into daily_state for spine and deck
-    chainwalk_daily_state["difficulty_epoch"] = difficulty_epoch_state
-    chainwalk_daily_state["miner_cohort"] = miner_cohort_state
-    chainwalk_daily_state["irreversibility"] = {
-        "band": irq_result.band,
-        "index": irq_result.index,
-        "date_utc": date_str,
-    }
-    chainwalk_daily_state["resolution"] = {
-        "band": rei.band,
-        "index": rei.index,
-        "date_utc": date_str,
-    }
-    chainwalk_daily_state["uncertainty"] = {
-        "band": uqi.band,
-        "index": uqi.index,
-        "date_utc": date_str,
-    }
+    # Only the measurement fields are hashed, so the hash can be taken before
+    # it is stored on the record.
+    daily.oracle_input_hash = compute_oracle_input_hash(daily.to_dict())
+    chainwalk_daily_state = daily.to_dict()
 
     # Write the final daily_state
-    with (reports_dir / "chainwalk_daily_state.json").open("w", encoding="utf-8") as f:
-        json.dump(chainwalk_daily_state, f, ensure_ascii=False, indent=2)
+    _write_json(reports_dir / "chainwalk_daily_state.json", chainwalk_daily_state)
 
     # Append outcome snapshot
     append_outcome_snapshot(reports_dir, chainwalk_daily_state, to_state_dict(mt_result))
@@ -1495,16 +1864,10 @@ def main() -> None:
 
     # Build ChainWalk Spine
     # Load intent_clock_state
-    intent_clock_state = {}
-    if (reports_dir / "intent_clock_state.json").exists():
-        with (reports_dir / "intent_clock_state.json").open("r", encoding="utf-8") as f:
-            intent_clock_state = json.load(f)
+    intent_clock_state = _load_json(reports_dir / "intent_clock_state.json", {})
 
     # Load regime_clock_state
-    regime_clock_state = {}
-    if (reports_dir / "regime_clock_state.json").exists():
-        with (reports_dir / "regime_clock_state.json").open("r", encoding="utf-8") as f:
-            regime_clock_state = json.load(f)
+    regime_clock_state = _load_json(reports_dir / "regime_clock_state.json", {})
 
     spine_line = build_spine_line(
         date_utc=date_str,
@@ -1515,15 +1878,12 @@ def main() -> None:
         intent_clock=intent_clock_state,
     )
 
-    # Save to chainwalk_spine_latest.txt
-    spine_path = reports_dir / "chainwalk_spine_latest.txt"
-    with spine_path.open("w", encoding="utf-8") as f:
-        f.write(spine_line + "\n")
-
-    # Optional history
-    history_path = reports_dir / "chainwalk_spine_history.log"
-    with history_path.open("a", encoding="utf-8") as f:
-        f.write(spine_line + "\n")
+    # Save to chainwalk_spine_latest.txt and the history log
+    _write_line_files(
+        spine_line,
+        reports_dir / "chainwalk_spine_latest.txt",
+        reports_dir / "chainwalk_spine_history.log",
+    )
 
     print(f"[daily_brief] ChainWalk Spine: {spine_line}")
 
@@ -1544,7 +1904,11 @@ def main() -> None:
     print(f"[daily_brief] APEX deck saved -> {apex_path}")
 
 
-if __name__ == "__main__":
+def run() -> int:
+    """
+    Run main() with the fatal-error handler; returns the process exit code.
+    Lets callers such as the CLI run the brief in-process.
+    """
     try:
         main()
     except Exception as exc:
@@ -1556,4 +1920,9 @@ if __name__ == "__main__":
         error_log = logs_dir / "scoreboard_error.log"
         with open(error_log, "a", encoding="utf-8") as f:
             f.write(f"{datetime.now().isoformat()} - {error_msg}\n")
-        sys.exit(1)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(run())
@@ -1,14 +1,23 @@
 #!/usr/bin/env python3
+import contextlib
+import io
 import sys
-import subprocess
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
 
 def run_command():
-    # Run the daily brief and print constraint stack + UQI
+    # Run the daily brief in-process and print constraint stack + UQI
     try:
-        result = subprocess.run([sys.executable, 'CHAINWALK_DAILY_BRIEF.py'], capture_output=True, text=True, cwd='.')
+        import CHAINWALK_DAILY_BRIEF as brief
+        buf = io.StringIO()
+        with contextlib.redirect_stdout(buf):
+            brief.run()
         print("Today's Constraint Stack + UQI:")
         # Extract relevant parts, for now print all
-        print(result.stdout)
+        print(buf.getvalue())
     except Exception as e:
         print(f"Error: {e}")
 
@@ -1,17 +1,61 @@
+import io
+import re
 from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
 from core.regime_metrics import ChainTensionSnapshot
 from core.llm_client import generate_text
 from utils.memory_of_price import MemorySnapshot
 
 Signal = Dict[str, Any]
 
+_NON_ASCII_RE = re.compile(r"[^\x00-\x7f]")
+
+_WEAK_RE = re.compile(
+    r"maybe|possibly|seems|nothing unusual|neutral|typical|appears|suggests|indicates",
+    re.IGNORECASE,
+)
+
 def assert_conviction(line: str) -> str:
-    weak = ["maybe", "possibly", "seems", "nothing unusual", "neutral", "typical", "appears", "suggests", "indicates"]
-    if any(w in line.lower() for w in weak):
+    if _WEAK_RE.search(line):
         raise ValueError("WEAK LANGUAGE DETECTED — VIOLATION OF APEX V4 CONVICTION RULE")
     return line
 
+_DESK_VERDICTS = (
+    "BITCOIN ASCENDANT",
+    "BITCOIN COILED — IGNITION IMMINENT",
+    "MARKET DELAYED — INEVITABILITY UNSCROLLED",
+    "SUPPLY TRAP SET — EXIT PRICE UNKNOWN",
+)
+_N_VERDICTS = len(_DESK_VERDICTS)
+
+_CUSTODY_VAULTWARD = "floating supply is dissolving into vaults"
+_CUSTODY_SEALED = "supply is sealed and cannot return to markets without price violence"
+
+_REGIME_TRIGGER = "entropy gradient compresses float"
+_INEVITABLE_ENDSTATE = "scarcity regime locks in"
+
+# Miner futures with conviction
+_ANTPOOL_FUTURE = "industrial capacity starves float"
+_FOUNDRY_FUTURE = "institutional hash protects floor"
+_VIABTC_FUTURE = "rotation compresses volatility"
+
+# The fixed lines never change, so they are held to the conviction rule once.
+for _line in (
+    *_DESK_VERDICTS,
+    _CUSTODY_VAULTWARD,
+    _CUSTODY_SEALED,
+    f"AntPool → {_ANTPOOL_FUTURE}",
+    f"FoundryUSA → {_FOUNDRY_FUTURE}",
+    f"ViaBTC → {_VIABTC_FUTURE}",
+    f"{_REGIME_TRIGGER} → {_INEVITABLE_ENDSTATE}",
+):
+    assert_conviction(_line)
+del _line
+
+# The live pool set is small, so each distinct name is classified once.
+@lru_cache(maxsize=256)
 def get_miner_persona(pool: str) -> str:
     pool_lower = pool.lower()
     if "antpool" in pool_lower:
@@ -27,17 +71,21 @@ def select_block_of_the_day(signals: List[Signal]) -> Dict[str, Any]:
     if not signals:
         return {}
 
-    # Sort by master_score if exists, else by entropy + complexity + poly bonus
-    def score_signal(s: Signal) -> float:
-        ms = s.get("master_score")
-        if ms is not None:
-            return ms
-        h = s.get("entropy_h") or s.get("entropy") or 0
-        k = s.get("complexity_k") or s.get("complexity") or 0
-        poly_bonus = 1.0 if s.get("polyphonic") else 0.0
-        return h + k + poly_bonus
-
-    best = max(signals, key=score_signal)
+    # Highest master_score if present, else entropy + complexity + poly bonus.
+    # Scored inline (no per-signal key callable); ties keep the earliest
+    # signal, as max() did.
+    best = None
+    best_score = 0.0
+    for s in signals:
+        score = s.get("master_score")
+        if score is None:
+            score = (
+                (s.get("entropy_h") or s.get("entropy") or 0)
+                + (s.get("complexity_k") or s.get("complexity") or 0)
+                + (1.0 if s.get("polyphonic") else 0.0)
+            )
+        if best is None or score > best_score:
+            best, best_score = s, score
 
     return {
         "height": best["height"],
@@ -112,8 +160,6 @@ Rules:
 - No bullet lists, no headings, just a clean, flowing paragraph.
 - Focus on explaining how today's tension profile fits into the bigger Bitcoin story.
 """
-    ai_narrative = generate_text(narrative_prompt, max_tokens=380)
-    ai_narrative = ai_narrative.encode('ascii', 'ignore').decode('ascii') if ai_narrative else "Narrative unavailable."
 
     # Viral quote - enforce conviction rule
     quote_prompt = f"""
@@ -133,24 +179,23 @@ Examples: “Bitcoin starves sellers and feeds time; every delay raises the exit
 DO NOT mention 'ChainWalk', 'tweet', 'this report', or 'followers'.
 Output ONLY the sentence, no quotes.
 """
-    viral_quote = generate_text(quote_prompt, max_tokens=64).strip()
-    viral_quote = viral_quote.encode('ascii', 'ignore').decode('ascii')  # strip unicode for Windows
+
+    # The two prompts are independent; run them side by side.
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        narrative_future = ex.submit(generate_text, narrative_prompt, max_tokens=380)
+        quote_future = ex.submit(generate_text, quote_prompt, max_tokens=64)
+        ai_narrative = narrative_future.result()
+        viral_quote = quote_future.result().strip()
+
+    ai_narrative = _NON_ASCII_RE.sub("", ai_narrative) if ai_narrative else "Narrative unavailable."
+    viral_quote = _NON_ASCII_RE.sub("", viral_quote)  # strip unicode for Windows
 
     # Compute required variables with conviction
-    custody_direction = "floating supply is dissolving into vaults" if snapshot.drivers.get("custody", 0) > 0.5 else "supply is sealed and cannot return to markets without price violence"
-    desk_verdict_options = [
-        "BITCOIN ASCENDANT",
-        "BITCOIN COILED — IGNITION IMMINENT",
-        "MARKET DELAYED — INEVITABILITY UNSCROLLED",
-        "SUPPLY TRAP SET — EXIT PRICE UNKNOWN"
-    ]
-    desk_verdict = desk_verdict_options[int(snapshot.chain_tension_index) % len(desk_verdict_options)]  # map CTI to verdict
-    assert_conviction(desk_verdict)
+    custody_direction = _CUSTODY_VAULTWARD if snapshot.drivers.get("custody", 0) > 0.5 else _CUSTODY_SEALED
+    desk_verdict = _DESK_VERDICTS[int(snapshot.chain_tension_index) % _N_VERDICTS]  # map CTI to verdict
 
     cti_line = "forces compression" if snapshot.chain_tension_index > 5 else "accelerates collapse"
     macro_thesis = "Miners seal the rails while Wall Street waits for permission. That gap births the next parabola."
-    regime_trigger = "entropy gradient compresses float"
-    inevitable_endstate = "scarcity regime locks in"
     block_height = bod.get('height', 0)
     block_thesis = "This block participated in the supply starvation cycle."
     if bod.get('entropy_h', 0) < 3:  # low entropy
@@ -159,49 +204,40 @@ Output ONLY the sentence, no quotes.
     block_signal_bullet_2 = "Custody starves sellers."
     block_signal_bullet_3 = "Fees lock in dominance."
 
-    # Miner futures with conviction
-    antpool_future = "industrial capacity starves float"
-    foundry_future = "institutional hash protects floor"
-    viabtc_future = "rotation compresses volatility"
-
-    custody_clock_line = custody_direction
-
-    # Enforce conviction on key lines
+    # Enforce conviction on the LLM line; the fixed lines are checked at import
     assert_conviction(viral_quote)
-    assert_conviction(f"AntPool → {antpool_future}")
-    assert_conviction(f"FoundryUSA → {foundry_future}")
-    assert_conviction(f"ViaBTC → {viabtc_future}")
-    assert_conviction(f"{regime_trigger} → {inevitable_endstate}")
-    assert_conviction(custody_clock_line)
 
     # Build markdown per APEX V4 template
-    lines = []
-    lines.append("# 📡 CHAINWALK APEX — THE BITCOIN CONVICTION DESK")
-    lines.append("")
-    lines.append(f"CTI: {snapshot.chain_tension_index:.1f} — {cti_line}")
-    lines.append(f"Custody Vector: {custody_direction}")
-    lines.append(f"Desk Verdict: {desk_verdict}")
-    lines.append("")
-    lines.append("## Macro Inflection")
-    lines.append(macro_thesis)
-    lines.append("")
-    lines.append("## Regime Flip Forecast")
-    lines.append(f"{regime_trigger} → {inevitable_endstate}")
-    lines.append("")
-    lines.append(f"## Block of the Day — {block_height}")
-    lines.append(block_thesis)
-    lines.append(f"- {block_signal_bullet_1}")
-    lines.append(f"- {block_signal_bullet_2}")
-    lines.append(f"- {block_signal_bullet_3}")
-    lines.append("")
-    lines.append("## Miner Power Map")
-    lines.append(f"AntPool → {antpool_future}")
-    lines.append(f"FoundryUSA → {foundry_future}")
-    lines.append(f"ViaBTC → {viabtc_future}")
-    lines.append("")
-    lines.append("## Custody Clock")
-    lines.append(custody_clock_line)
-    lines.append("")
+    out = io.StringIO()
+    w = out.write
+    w(
+        "# 📡 CHAINWALK APEX — THE BITCOIN CONVICTION DESK\n"
+        "\n"
+        f"CTI: {snapshot.chain_tension_index:.1f} — {cti_line}\n"
+        f"Custody Vector: {custody_direction}\n"
+        f"Desk Verdict: {desk_verdict}\n"
+        "\n"
+        "## Macro Inflection\n"
+        f"{macro_thesis}\n"
+        "\n"
+        "## Regime Flip Forecast\n"
+        f"{_REGIME_TRIGGER} → {_INEVITABLE_ENDSTATE}\n"
+        "\n"
+        f"## Block of the Day — {block_height}\n"
+        f"{block_thesis}\n"
+        f"- {block_signal_bullet_1}\n"
+        f"- {block_signal_bullet_2}\n"
+        f"- {block_signal_bullet_3}\n"
+        "\n"
+        "## Miner Power Map\n"
+        f"AntPool → {_ANTPOOL_FUTURE}\n"
+        f"FoundryUSA → {_FOUNDRY_FUTURE}\n"
+        f"ViaBTC → {_VIABTC_FUTURE}\n"
+        "\n"
+        "## Custody Clock\n"
+        f"{custody_direction}\n"
+        "\n"
+    )
 
     # MEMORY OF PRICE section
     if memory_snapshot:
@@ -244,19 +280,20 @@ Output ONLY the sentence, no quotes.
         for line in [trajectory_line, cti_path_line, custody_line, entropy_line, fee_line, inevitable_path_line]:
             assert_conviction(line)
 
-        lines.append("## MEMORY OF PRICE")
-        lines.append("")
-        lines.append(f"**Trajectory:** {trajectory_line}")
-        lines.append("")
-        lines.append(f"- CTI path: {cti_path_line}")
-        lines.append(f"- Custody drift: {custody_line}")
-        lines.append(f"- Entropy field: {entropy_line}")
-        lines.append(f"- Miner fee gravity: {fee_line}")
-        lines.append("")
-        lines.append(f"**Inevitable path:** {inevitable_path_line}")
-        lines.append("")
-
-    lines.append("## Viral Quote")
-    lines.append(f"**{viral_quote}**")
-
-    return "\n".join(lines)
\ No newline at end of file
+        w(
+            "## MEMORY OF PRICE\n"
+            "\n"
+            f"**Trajectory:** {trajectory_line}\n"
+            "\n"
+            f"- CTI path: {cti_path_line}\n"
+            f"- Custody drift: {custody_line}\n"
+            f"- Entropy field: {entropy_line}\n"
+            f"- Miner fee gravity: {fee_line}\n"
+            "\n"
+            f"**Inevitable path:** {inevitable_path_line}\n"
+            "\n"
+        )
+
+    w(f"## Viral Quote\n**{viral_quote}**")
+
+    return out.getvalue()
@@ -17,6 +17,28 @@ _DEFAULT = {
 _CONFIG = None
 
 
+def _nonempty(v: str) -> str:
+    if not v:
+        raise ValueError("empty override")
+    return v
+
+
+def _flag(v: str) -> bool:
+    return v == "1"
+
+
+# (env var, config key, cast)
+_ENV_MAP = (
+    ("SOV_OLLAMA_BASE_URL", "ollama_base_url", _nonempty),
+    ("SOV_OLLAMA_MODEL", "ollama_model", _nonempty),
+    ("SOV_DOCENT_ON", "docent_enabled", _flag),
+    ("SOV_DOCENT_MAX_CALLS", "docent_max_calls", int),
+    ("SOV_TOUR_DELAY_SECS", "tour_delay_secs", int),
+    ("SOV_TOUR_STICKY", "tour_sticky", _flag),
+    ("SOV_VERBOSE", "verbose", _flag),
+)
+
+
 def _load_config_file() -> dict:
     """Load config.json from project root, if present."""
     root = pathlib.Path(__file__).resolve().parent.parent
@@ -47,35 +69,16 @@ def get_config() -> dict:
     cfg = dict(_DEFAULT)
     cfg.update(_load_config_file())
 
-    # Env overrides
-    base_url = os.getenv("SOV_OLLAMA_BASE_URL")
-    model = os.getenv("SOV_OLLAMA_MODEL")
-    docent_on = os.getenv("SOV_DOCENT_ON")
-    docent_max = os.getenv("SOV_DOCENT_MAX_CALLS")
-    tour_delay = os.getenv("SOV_TOUR_DELAY_SECS")
-    tour_sticky = os.getenv("SOV_TOUR_STICKY")
-    verbose = os.getenv("SOV_VERBOSE")
-
-    if base_url:
-        cfg["ollama_base_url"] = base_url
-    if model:
-        cfg["ollama_model"] = model
-    if docent_on is not None:
-        cfg["docent_enabled"] = docent_on == "1"
-    if docent_max:
-        try:
-            cfg["docent_max_calls"] = int(docent_max)
-        except ValueError:
-            pass
-    if tour_delay:
+    # Env overrides; a cast that raises ValueError leaves the value alone
+    env = os.environ
+    for env_key, cfg_key, cast in _ENV_MAP:
+        raw = env.get(env_key)
+        if raw is None:
+            continue
         try:
-            cfg["tour_delay_secs"] = int(tour_delay)
+            cfg[cfg_key] = cast(raw)
         except ValueError:
             pass
-    if tour_sticky is not None:
-        cfg["tour_sticky"] = tour_sticky == "1"
-    if verbose is not None:
-        cfg["verbose"] = verbose == "1"
 
     _CONFIG = cfg
     return _CONFIG
@@ -1,18 +1,28 @@
 import hashlib
 import json
 import os
+import sqlite3
+import threading
 import time
 from typing import Any, Dict, Optional
 
 from .config import get_config
-from .llm_client import generate_text
 
 _cfg = get_config()
+_DOCENT_ENABLED = bool(_cfg.get("docent_enabled", True))
+_DOCENT_MAX_CALLS = int(_cfg.get("docent_max_calls", 32))
+_DOCENT_CALLS = 0  # LLM calls made by this process
+_CALLS_LOCK = threading.Lock()
 CACHE_PATH = os.environ.get("SOV_DOCENT_CACHE", "cache/docent_cache.jsonl")
 MAX_AGE_SECS = int(os.environ.get("SOV_DOCENT_MAX_AGE_SECS", "31536000"))  # 1 year
 
 
 def _key_for_block(block: Dict[str, Any]) -> str:
+    # Stashed on the block after the first call so repeat lookups of the
+    # same dict (batched passes, rebuilds) skip the join and hash.
+    cached = block.get("_docent_key")
+    if cached is not None:
+        return cached
     h = block.get("height")
     pool = block.get("pool")
     txs = block.get("txs")
@@ -20,37 +30,91 @@ def _key_for_block(block: Dict[str, Any]) -> str:
     largest = block.get("largest_btc") or block.get("largest")
     channels = ",".join(block.get("channels", []))
     basis = f"{h}|{pool}|{txs}|{total}|{largest}|{channels}"
-    return hashlib.sha1(basis.encode("utf-8")).hexdigest()[:16]
-
-
-def _read_cached(key: str) -> Optional[Dict[str, Any]]:
+    # 64-bit key, same width as the old truncated SHA-1 hex.
+    key = hashlib.blake2b(basis.encode("utf-8"), digest_size=8).hexdigest()
+    block["_docent_key"] = key
+    return key
+
+
+# The cache lives in SQLite next to where the JSONL log used to be: indexed
+# lookups, atomic upserts, and safe to share between mirror workers (WAL).
+# A legacy JSONL cache at CACHE_PATH is imported once, into an empty DB.
+CACHE_DB_PATH = os.path.splitext(CACHE_PATH)[0] + ".db"
+_CONN: Optional[sqlite3.Connection] = None
+# One connection shared by any threads calling in, used under a lock.
+_CACHE_LOCK = threading.Lock()
+
+
+def _cache_conn() -> sqlite3.Connection:
+    # Callers hold _CACHE_LOCK.
+    global _CONN
+    if _CONN is None:
+        os.makedirs(os.path.dirname(CACHE_DB_PATH) or ".", exist_ok=True)
+        conn = sqlite3.connect(CACHE_DB_PATH, isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS c("
+            "k TEXT PRIMARY KEY, ts INTEGER, headline TEXT, text TEXT)"
+        )
+        if conn.execute("SELECT 1 FROM c LIMIT 1").fetchone() is None:
+            _import_jsonl(conn)
+        _CONN = conn
+    return _CONN
+
+
+def _import_jsonl(conn: sqlite3.Connection) -> None:
+    """Copy rows from the old append-only JSONL cache; later lines win."""
+    rows = []
     try:
         with open(CACHE_PATH, "r", encoding="utf-8") as f:
             for line in f:
                 try:
-                    row = json.loads(line)
+                    r = json.loads(line)
+                    rows.append((r["k"], int(r.get("ts", 0)), r["headline"], r["text"]))
                 except Exception:
                     continue
-                if row.get("k") == key:
-                    if time.time() - row.get("ts", 0) <= MAX_AGE_SECS:
-                        return row
-    except FileNotFoundError:
-        pass
-    return None
+    except OSError:
+        return
+    if rows:
+        with conn:
+            conn.execute("BEGIN")
+            conn.executemany("INSERT OR REPLACE INTO c VALUES (?, ?, ?, ?)", rows)
+
+
+def _read_cached(key: str) -> Optional[Dict[str, Any]]:
+    # An unusable cache (locked, corrupt, read-only dir) is just a miss.
+    try:
+        with _CACHE_LOCK:
+            row = _cache_conn().execute(
+                "SELECT ts, headline, text FROM c WHERE k = ? AND ts >= ?",
+                (key, time.time() - MAX_AGE_SECS),
+            ).fetchone()
+    except (sqlite3.Error, OSError):
+        return None
+    if row is None:
+        return None
+    ts, headline, text = row
+    return {"ts": ts, "k": key, "headline": headline, "text": text}
 
 
 def _write_cached(key: str, payload: Dict[str, Any]) -> None:
-    os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
-    row = {"ts": int(time.time()), "k": key, **payload}
-    with open(CACHE_PATH, "a", encoding="utf-8") as f:
-        f.write(json.dumps(row, ensure_ascii=False) + "\n")
+    try:
+        with _CACHE_LOCK:
+            _cache_conn().execute(
+                "INSERT OR REPLACE INTO c VALUES (?, ?, ?, ?)",
+                (key, int(time.time()), payload["headline"], payload["text"]),
+            )
+    except (sqlite3.Error, OSError):
+        pass
 
 
 def _fmt(v, unit="BTC"):
+    # Feeds a prompt, not a UI: no thousands grouping.
     if v is None:
         return "—"
     try:
-        return f"{float(v):,.3f} {unit}"
+        return f"{float(v):.3f} {unit}"
     except Exception:
         return str(v)
 
@@ -61,14 +125,13 @@ def _finance_line(b: Dict[str, Any]) -> str:
     fees = b.get("fees_btc") or b.get("fees")
     largest = b.get("largest_btc") or b.get("largest")
     pct = b.get("fees_pct")
-    if pct is not None:
+    if pct is None:
+        pct_str = "—"
+    else:
         try:
-            pct_val = float(pct)
-            pct_str = f"{pct_val:0.000%}"
+            pct_str = f"{float(pct):.3%}"
         except Exception:
             pct_str = str(pct)
-    else:
-        pct_str = "—"
     return (
         f"txs: {txs} · total out: {_fmt(total)} · "
         f"fees: {_fmt(fees)} ({pct_str}) · largest: {_fmt(largest)}"
@@ -99,13 +162,15 @@ def _fallback_story(block: Dict[str, Any]) -> Dict[str, str]:
     return {"headline": headline, "text": text}
 
 
-def describe_block(block: Dict[str, Any]) -> Dict[str, str]:
+def describe_block(block: Dict[str, Any], use_llm: bool = True) -> Dict[str, str]:
     """
     Returns {'headline': str, 'text': str} for a block.
 
     Uses cache first; prompts the LLM only on a cache miss, and respects
-    config/env for docent_enabled + max_calls.
+    config/env for docent_enabled + max_calls. With use_llm=False a miss
+    goes straight to the fallback summary.
     """
+    global _DOCENT_CALLS
     key = _key_for_block(block)
 
     # 1) cache hit?
@@ -113,18 +178,13 @@ def describe_block(block: Dict[str, Any]) -> Dict[str, str]:
     if cached and "headline" in cached and "text" in cached:
         return {"headline": cached["headline"], "text": cached["text"]}
 
-    # 2) consult config for whether LLM is allowed
-    cfg = get_config()
-    docent_enabled = bool(cfg.get("docent_enabled", True))
-    max_calls = int(cfg.get("docent_max_calls", 32))
-
-    # global call counter (per-process)
-    if not hasattr(describe_block, "_calls"):
-        setattr(describe_block, "_calls", 0)
-
-    calls = getattr(describe_block, "_calls")  # type: ignore[assignment]
-
-    if (not docent_enabled) or (calls >= max_calls):
+    # 2) is the LLM allowed? (config read once at import). The call slot is
+    # claimed up front so concurrent callers can't overshoot.
+    with _CALLS_LOCK:
+        allowed = use_llm and _DOCENT_ENABLED and _DOCENT_CALLS < _DOCENT_MAX_CALLS
+        if allowed:
+            _DOCENT_CALLS += 1
+    if not allowed:
         return _fallback_story(block)
 
     # 3) Build prompt & call LLM
@@ -158,6 +218,9 @@ Rules:
 """
 
     try:
+        # Imported here so cache/fallback-only callers never load requests.
+        from .llm_client import generate_text
+
         text = generate_text(prompt, max_tokens=260)
         headline = "Desk analyst insight"
         payload = {"headline": headline, "text": text.strip()}
@@ -167,9 +230,6 @@ Rules:
             "text": f"(docent error: {e})",
         }
 
-    # bump call counter
-    setattr(describe_block, "_calls", calls + 1)  # type: ignore[arg-type]
-
     # 4) persist
     try:
         _write_cached(key, payload)
@@ -187,18 +247,7 @@ def build_story(block: Dict[str, Any], use_llm: bool = True, **kwargs) -> str:
       or fallback summary.
     - If use_llm is True, we still respect config.json/env call limits.
     """
-    if not use_llm:
-        # temporarily pretend docent is disabled so describe_block
-        # goes straight to fallback or cache
-        cfg = get_config()
-        original = cfg.get("docent_enabled", True)
-        cfg["docent_enabled"] = False
-        try:
-            res = describe_block(block)
-        finally:
-            cfg["docent_enabled"] = original
-    else:
-        res = describe_block(block)
+    res = describe_block(block, use_llm=use_llm)
 
     # mirror_builder expects plain text today; we put headline on first line
     headline = res.get("headline", "AI docent note")
@@ -142,25 +142,32 @@ EXTRA_JS = r"""
 </script>
 """
 
+# Byte forms of the patch so injection never decodes/re-encodes the page.
+_EXTRA_CSS_BYTES = EXTRA_CSS.encode("utf-8")
+_EXTRA_JS_BYTES = EXTRA_JS.encode("utf-8")
+_MARKER = b"<!-- V8 docent FX -->"
+_HEAD_CLOSE = b"</head>"
+_BODY_CLOSE = b"</body>"
+
 def inject_docent_fx(out_path: Path) -> None:
   """Inject V8 CSS/JS into MESSAGE_MIRROR.html (idempotent)."""
   try:
-    html = out_path.read_text(encoding="utf-8")
+    html = out_path.read_bytes()
   except FileNotFoundError:
     return
 
-  if "<!-- V8 docent FX -->" in html:
+  if _MARKER in html:
     # Already patched
     return
 
-  if "</head>" in html:
-    html = html.replace("</head>", EXTRA_CSS + "\n</head>", 1)
+  if _HEAD_CLOSE in html:
+    html = html.replace(_HEAD_CLOSE, _EXTRA_CSS_BYTES + b"\n" + _HEAD_CLOSE, 1)
   else:
-    html = EXTRA_CSS + html
+    html = _EXTRA_CSS_BYTES + html
 
-  if "</body>" in html:
-    html = html.replace("</body>", EXTRA_JS + "\n</body>", 1)
+  if _BODY_CLOSE in html:
+    html = html.replace(_BODY_CLOSE, _EXTRA_JS_BYTES + b"\n" + _BODY_CLOSE, 1)
   else:
-    html = html + EXTRA_JS
+    html = html + _EXTRA_JS_BYTES
 
-  out_path.write_text(html, encoding="utf-8")
+  out_path.write_bytes(html)
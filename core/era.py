@@ -1,3 +1,4 @@
+from bisect import bisect_right
 from dataclasses import dataclass
 from typing import Optional
 
@@ -19,30 +20,26 @@ ERA_BANDS = [
     EraInfo("post_etf",      "Post-ETF",       700000,  1000000000),  # special case
 ]
 
+# Height boundaries between the eras and the slug for each interval; the
+# last interval splits on ETF_TIMESTAMP.
+_BOUNDARIES = (200000, 350000, 550000, 700000)
+_SLUGS = ("satoshi", "early_gpu", "asic_wars", "segwit", "institutional")
+_LAST = len(_SLUGS) - 1
+
+_LABEL_BY_SLUG = {e.slug: e.label for e in ERA_BANDS}
+_VALID_SLUGS = frozenset(_LABEL_BY_SLUG)
+
 def get_era(height: Optional[int], timestamp: Optional[int] = None) -> str:
     if height is None:
         return "unknown"
-    if height < 200000:
-        return "satoshi"
-    elif height < 350000:
-        return "early_gpu"
-    elif height < 550000:
-        return "asic_wars"
-    elif height < 700000:
-        return "segwit"
-    elif height >= 700000:
-        if timestamp and timestamp >= ETF_TIMESTAMP:
-            return "post_etf"
-        else:
-            return "institutional"
-    return "unknown"
+    idx = bisect_right(_BOUNDARIES, height)
+    if idx == _LAST and timestamp and timestamp >= ETF_TIMESTAMP:
+        return "post_etf"
+    return _SLUGS[idx]
 
 def label_for_slug(slug: str) -> str:
-    for band in ERA_BANDS:
-        if band.slug == slug:
-            return band.label
-    # fallback (should be rare)
-    return "Unknown"
+    # fallback "Unknown" should be rare
+    return _LABEL_BY_SLUG.get(slug, "Unknown")
 
 def infer_era(block: dict) -> tuple[str, str]:
     """
@@ -51,8 +48,11 @@ def infer_era(block: dict) -> tuple[str, str]:
     2) mapped from block['era'] if that's a slug-ish string,
     3) height/timestamp-based otherwise.
     """
-    # 1) direct slug field
-    slug = (block.get("era_slug") or "").lower().strip()
+    # 1) direct slug field; a clean slug needs no normalising
+    raw = block.get("era_slug")
+    if type(raw) is str and raw in _VALID_SLUGS:
+        return raw, _LABEL_BY_SLUG[raw]
+    slug = (raw or "").lower().strip()
     if slug:
         return slug, label_for_slug(slug)
 
@@ -60,7 +60,7 @@ def infer_era(block: dict) -> tuple[str, str]:
     era_field = (block.get("era") or "").lower().strip()
     if era_field.startswith("era:"):
         era_field = era_field.split(":", 1)[1]
-    if era_field in {e.slug for e in ERA_BANDS}:
+    if era_field in _VALID_SLUGS:
         return era_field, label_for_slug(era_field)
 
     # 3) height/timestamp-based
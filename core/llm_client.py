@@ -15,6 +15,7 @@ import os
 from typing import List, Dict, Any
 
 import requests
+from requests.adapters import HTTPAdapter
 
 # ---------------------------------------------------------------------
 # Configuration
@@ -35,6 +36,17 @@ OLLAMA_MODEL = _cfg.get("ollama_model", "gemma3:12b")
 DEFAULT_MAX_TOKENS = 320
 
 
+# How long Ollama keeps the model loaded after a request (its default is 5m,
+# which forces cold reloads between spaced-out brief/docent calls).
+KEEP_ALIVE = "30m"
+
+# One pooled session so repeated calls reuse the TCP connection.
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=0)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+
+
 class LLMClientError(RuntimeError):
     """Custom error for LLM client failures."""
 
@@ -54,6 +66,7 @@ def _post_chat(messages: List[Dict[str, Any]],
         "model": OLLAMA_MODEL,
         "messages": messages,
         "stream": False,
+        "keep_alive": KEEP_ALIVE,
         # Some models ignore "num_predict"; included for best-effort control.
         "options": {
             "num_predict": max_tokens,
@@ -61,7 +74,7 @@ def _post_chat(messages: List[Dict[str, Any]],
     }
 
     try:
-        resp = requests.post(url, json=payload, timeout=120)
+        resp = _SESSION.post(url, json=payload, timeout=120)
     except Exception as exc:  # noqa: BLE001
         raise LLMClientError(f"Failed to reach Ollama at {url}: {exc}") from exc
 
@@ -107,6 +120,21 @@ def generate_text(prompt: str,
 
 
 def health_check() -> bool:
+    """
+    Quick check that Ollama is reachable.
+
+    Hits /api/tags (lists local models, no inference), so it is cheap enough
+    to call before every render. Use deep_health_check() to confirm the
+    model actually loads and answers.
+    """
+    try:
+        resp = _SESSION.get(f"{OLLAMA_URL.rstrip('/')}/api/tags", timeout=2)
+        return resp.ok
+    except Exception:
+        return False
+
+
+def deep_health_check() -> bool:
     """
     Quick check that Ollama is reachable and the model loads.
 
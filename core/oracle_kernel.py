@@ -3,7 +3,10 @@
 # Under 1000 LOC. If it grows, the oracle dies.
 
 import hashlib
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
 import json
+import re
 from typing import Dict, List, Any
 
 # Constraint formulae — immutable definitions
@@ -38,82 +41,74 @@ def measure_chain_state(block_data: Dict[str, Any]) -> Dict[str, float]:
         "irreversibility": irreversibility
     }
 
+# Band tables: (thresholds, labels). bisect_right for "x < t" ladders,
+# bisect_left for the UQI "x > t" ladder (labels listed low to high).
+_CTI_BANDS = ((0.5, 1.0), ("low", "medium", "high"))
+_MTI_BANDS = ((0.1, 0.5), ("below", "strained", "critical"))
+_IRQ_BANDS = ((0.3, 0.7), ("reversible", "primed", "irreversible"))
+_REI_BANDS = ((0.4, 0.7), ("dormant", "active", "terminal"))
+_UQI_BANDS = ((0.3, 0.7), ("collapsed", "narrowing", "open"))
+
+def _bands(values: List[float], table, find=bisect_right) -> List[str]:
+    thresholds, labels = table
+    return [labels[find(thresholds, v)] for v in values]
+
+def compute_constraint_stack_batch(states: List[Dict[str, float]]) -> Dict[str, Dict[str, List[Any]]]:
+    """
+    Pure function: constraint stack for many states at once.
+    Input: list of states from measure_chain_state.
+    Output: same keys as compute_constraint_stack, each holding parallel
+    "value" and "band" lists (one entry per state).
+    """
+    tension = [st["tension"] for st in states]
+    miner_pressure = [st["miner_pressure"] for st in states]
+    irreversibility = [st["irreversibility"] for st in states]
+    convergence = [(t + m + i) / 3 for t, m, i in zip(tension, miner_pressure, irreversibility)]
+    uqi = [1 - c for c in convergence]
+
+    return {
+        "cti": {"value": tension, "band": _bands(tension, _CTI_BANDS)},
+        "mti": {"value": miner_pressure, "band": _bands(miner_pressure, _MTI_BANDS)},
+        "irq": {"value": irreversibility, "band": _bands(irreversibility, _IRQ_BANDS)},
+        "rei": {"value": convergence, "band": _bands(convergence, _REI_BANDS)},
+        "uqi": {"value": uqi, "band": _bands(uqi, _UQI_BANDS, bisect_left)},
+    }
+
 def compute_constraint_stack(state: Dict[str, float]) -> Dict[str, Any]:
     """
     Pure function: Compute full constraint stack.
     Input: state from measure_chain_state.
     Output: CTI, MTI, IRQ, REI, UQI with bands.
     """
-    tension = state["tension"]
-    miner_pressure = state["miner_pressure"]
-    irreversibility = state["irreversibility"]
-
-    # CTI bands
-    if tension < 0.5:
-        cti_band = "low"
-    elif tension < 1.0:
-        cti_band = "medium"
-    else:
-        cti_band = "high"
-
-    # MTI bands
-    if miner_pressure < 0.1:
-        mti_band = "below"
-    elif miner_pressure < 0.5:
-        mti_band = "strained"
-    else:
-        mti_band = "critical"
-
-    # IRQ bands
-    if irreversibility < 0.3:
-        irq_band = "reversible"
-    elif irreversibility < 0.7:
-        irq_band = "primed"
-    else:
-        irq_band = "irreversible"
-
-    # REI: convergence
-    convergence = (tension + miner_pressure + irreversibility) / 3
-    if convergence < 0.4:
-        rei_band = "dormant"
-    elif convergence < 0.7:
-        rei_band = "active"
-    else:
-        rei_band = "terminal"
-
-    # UQI: uncertainty
-    uqi = 1 - convergence
-    if uqi > 0.7:
-        uqi_band = "open"
-    elif uqi > 0.3:
-        uqi_band = "narrowing"
-    else:
-        uqi_band = "collapsed"
-
+    batch = compute_constraint_stack_batch([state])
     return {
-        "cti": {"value": tension, "band": cti_band},
-        "mti": {"value": miner_pressure, "band": mti_band},
-        "irq": {"value": irreversibility, "band": irq_band},
-        "rei": {"value": convergence, "band": rei_band},
-        "uqi": {"value": uqi, "band": uqi_band}
+        key: {"value": col["value"][0], "band": col["band"][0]}
+        for key, col in batch.items()
     }
 
+_FORBIDDEN_WORDS = ("price", "llm", "sentiment", "off-chain", "oracle")
+_FORBIDDEN_RE = re.compile("|".join(map(re.escape, _FORBIDDEN_WORDS)), re.IGNORECASE)
+
 def verify_oracle_integrity(code: str) -> bool:
     """
     Pure function: Verify kernel integrity.
     Input: code string.
     Output: True if no forbidden patterns.
     """
-    forbidden = ["price", "llm", "sentiment", "off-chain", "oracle"]
-    for word in forbidden:
-        if word.lower() in code.lower():
-            return False
-    return True
+    return _FORBIDDEN_RE.search(code) is None
 
 # Kernel hash generation
+@lru_cache(maxsize=1)
 def generate_kernel_hash() -> str:
-    kernel_code = open(__file__, 'r').read()
-    return hashlib.sha256(kernel_code.encode()).hexdigest()
+    # The kernel source can't change under a running process, so hash once,
+    # streaming the file (hashlib.file_digest on 3.11+, chunked before that).
+    with open(__file__, "rb") as f:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        h = hashlib.sha256()
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+        return h.hexdigest()
 
 def generate_constraint_hash() -> str:
     formulae_str = json.dumps(CONSTRAINT_FORMULAE, sort_keys=True)
@@ -1,6 +1,6 @@
+import sys
 from dataclasses import dataclass
 from typing import List, Dict, Any, Optional
-from collections import Counter
 
 Signal = Dict[str, Any]
 
@@ -42,48 +42,67 @@ def compute_snapshot(signals: List[Signal]) -> ChainTensionSnapshot:
 
     block_count = len(signals)
 
+    # One pass over the signal dicts: running sums and counts only, and the
+    # channels dict fetched once per signal. Signals arrive canonicalized
+    # (entropy / complexity / largest_tx_btc); an entropy_h / complexity_k
+    # alias is only left on signals that also carry the canonical key, and
+    # still takes precedence there.
+    poly_count = 0
+    sum_H = sum_K = sum_fee = 0
+    n_H = n_K = n_fee = 0
+    whale_blocks = 0
+    custody_signals = 0
+    pool_counts: Dict[Any, int] = {}
+    for s in signals:
+        if s.get("polyphonic"):
+            poly_count += 1
+
+        h = s.get("entropy_h") or s.get("entropy")
+        if h:
+            sum_H += h
+            n_H += 1
+        k = s.get("complexity_k") or s.get("complexity")
+        if k:
+            sum_K += k
+            n_K += 1
+
+        fee = s.get("fees_pct")
+        if fee is not None:
+            sum_fee += min(1.0, max(0.0, fee))
+            n_fee += 1
+
+        chans = s.get("channels") or {}
+        if chans.get("whale_flow"):
+            whale_blocks += 1
+        else:
+            lt = s.get("largest_tx_btc")
+            if lt and lt >= 50:
+                whale_blocks += 1
+        if chans.get("custody_shift"):
+            custody_signals += 1
+
+        pool = s.get("pool", "unknown")
+        if type(pool) is str:
+            pool = sys.intern(pool)
+        pool_counts[pool] = pool_counts.get(pool, 0) + 1
+
     # Polyphonic rate
-    polys = [s for s in signals if s.get("polyphonic")]
-    poly_rate = len(polys) / block_count
+    poly_rate = poly_count / block_count
 
     # Entropy / complexity
-    entropies = [s.get("entropy_h") or s.get("entropy") for s in signals if s.get("entropy_h") or s.get("entropy")]
-    complexities = [s.get("complexity_k") or s.get("complexity") for s in signals if s.get("complexity_k") or s.get("complexity")]
-    avg_H = sum(entropies) / len(entropies) if entropies else 0.0
-    avg_K = sum(complexities) / len(complexities) if complexities else 0.0
+    avg_H = sum_H / n_H if n_H else 0.0
+    avg_K = sum_K / n_K if n_K else 0.0
 
     # Fee pressure (0–1)
-    fee_ps = []
-    for s in signals:
-        v = s.get("fees_pct")
-        if v is not None:
-            fee_ps.append(min(1.0, max(0.0, v)))
-    avg_fee_pressure = sum(fee_ps) / len(fee_ps) if fee_ps else 0.0
+    avg_fee_pressure = sum_fee / n_fee if n_fee else 0.0
 
     # Whale tx share (0–1)
-    whale_blocks = 0
-    for s in signals:
-        if s.get("channels", {}).get("whale_flow"):
-            whale_blocks += 1
-        else:
-            lt = s.get("largest_tx_btc") or s.get("largest_tx")
-            if lt and lt >= 50:
-                whale_blocks += 1
     whale_share = whale_blocks / block_count
 
-    # Miner concentration (0–1)
-    pools = [s.get("pool", "unknown") for s in signals]
-    c = Counter(pools)
-    total = block_count
-    shares = [cnt / total for cnt in c.values()]
-    miner_concentration = sum(sh * sh for sh in shares)  # Herfindahl
+    # Miner concentration (0–1): Herfindahl from integer block counts
+    miner_concentration = sum(c * c for c in pool_counts.values()) / (block_count * block_count)
 
     # Custody bias (-1 → +1)
-    custody_signals = 0
-    for s in signals:
-        chans = s.get("channels", {})
-        if chans.get("custody_shift"):
-            custody_signals += 1
     custody_bias = 0.0  # Placeholder, as per spec
 
     # Chain Tension Index (0–10)
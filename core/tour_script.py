@@ -13,22 +13,28 @@ We keep this deliberately small:
 - Entropy extremes
 """
 
+import heapq
 from typing import Any, Dict, List
 
 
 def _safe_float(v: Any, default: float = 0.0) -> float:
+    # Exact-type fast path: most catalog values are already floats.
+    if type(v) is float:
+        return v
+    if v is None:
+        return default
     try:
-        if v is None:
-            return default
         return float(v)
     except Exception:
         return default
 
 
 def _safe_int(v: Any, default: int = 0) -> int:
+    if type(v) is int:
+        return v
+    if v is None:
+        return default
     try:
-        if v is None:
-            return default
         return int(v)
     except Exception:
         return default
@@ -98,27 +104,33 @@ def build_tours(signals: List[Dict[str, Any]]) -> Dict[str, Any]:
             )
         return {"id": name, "title": title, "stops": stops}
 
-    # 1) Latest high-score blocks (recent tip window)
-    recent = sorted(signals, key=height, reverse=True)[:512]
-    recent_sorted = sorted(
-        recent, key=lambda s: (_safe_float(s.get("master_score")), height(s)), reverse=True
-    )
+    # Sort keys are extracted once into parallel lists and the playlists are
+    # chosen by index, so no comparator re-parses a signal field.
+    n = len(signals)
+    heights = [height(s) for s in signals]
+    scores = [_safe_float(s.get("master_score")) for s in signals]
+    largests = [largest(s) for s in signals]
+
+    # 1) Latest high-score blocks (recent tip window); nlargest keeps the
+    # order sorted(..., reverse=True)[:512] would give, ties included.
+    recent_idx = heapq.nlargest(512, range(n), key=heights.__getitem__)
+    recent_idx.sort(key=lambda i: (scores[i], heights[i]), reverse=True)
+    recent_sorted = [signals[i] for i in recent_idx]
     for s in recent_sorted:
         s.setdefault("tour_reason", []).append("high_score_recent")
 
     # 2) Whale gallery
-    whales = [s for s in signals if largest(s) >= 1500.0]
-    whales_sorted = sorted(whales, key=lambda s: largest(s), reverse=True)
+    whale_idx = [i for i in range(n) if largests[i] >= 1500.0]
+    whale_idx.sort(key=largests.__getitem__, reverse=True)
+    whales_sorted = [signals[i] for i in whale_idx]
     for s in whales_sorted:
         s.setdefault("tour_reason", []).append("whale_transfer")
 
-    # 3) Entropy extremes
+    # 3) Entropy extremes: distance from mid entropy, computed once per
+    # signal; nlargest matches sorted(..., reverse=True)[:256].
     mid_h = 4.5
-    extremes = sorted(
-        signals,
-        key=lambda s: abs(entropy(s) - mid_h),
-        reverse=True,
-    )[:256]
+    dist = [abs(entropy(s) - mid_h) for s in signals]
+    extremes = [signals[i] for i in heapq.nlargest(256, range(n), key=dist.__getitem__)]
     for s in extremes:
         s.setdefault("tour_reason", []).append("entropy_extreme")
 
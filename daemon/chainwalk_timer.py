@@ -3,7 +3,10 @@
 # Logs spines to chainwalk_spine_history.log
 # Auto-generates weekly compression_tape_YYYY-MM-DD.md
 
-import subprocess
+import contextlib
+import importlib.util
+import io
+import json
 import time
 import datetime
 import os
@@ -12,50 +15,108 @@ from pathlib import Path
 SCRIPT_DIR = Path(__file__).parent.parent
 DAILY_SCRIPT = SCRIPT_DIR / "CHAINWALK_DAILY_BRIEF.py"
 SPINE_LOG = SCRIPT_DIR / "reports" / "chainwalk_spine_history.log"
+# Date of the last successful daily run, so a restart doesn't skip or repeat a day.
+TIMER_STATE = SCRIPT_DIR / "reports" / "chainwalk_timer_state.json"
+
+# The brief is loaded on the first run and then reused in-process each day:
+# no interpreter start-up or re-import per run, and its caches stay warm
+# between days. Loading lazily keeps an import failure a per-run error.
+_daily_mod = None
+
+def _load_daily_brief():
+    global _daily_mod
+    if _daily_mod is None:
+        spec = importlib.util.spec_from_file_location("chainwalk_daily", DAILY_SCRIPT)
+        mod = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(mod)
+        _daily_mod = mod
+    return _daily_mod
 
 def run_daily_brief():
-    """Run the daily brief script."""
+    """Run the daily brief script; returns True if it succeeded.
+
+    SPINE_LOG is opened just for each entry: the log gets rotated, and a
+    handle held across runs would keep writing to the unlinked file.
+    """
     try:
-        result = subprocess.run(["python", str(DAILY_SCRIPT)], cwd=SCRIPT_DIR, capture_output=True, text=True)
-        if result.returncode == 0:
-            print(f"[{datetime.datetime.now()}] Daily brief completed successfully.")
+        out, err = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            returncode = _load_daily_brief().run()
+        now = datetime.datetime.now()
+        if returncode == 0:
+            print(f"[{now}] Daily brief completed successfully.")
             # Extract spine from output or logs
             # For simplicity, append a timestamped entry
+            entry = f"{now.isoformat()} | Daily brief executed\n"
+            SPINE_LOG.parent.mkdir(parents=True, exist_ok=True)
             with open(SPINE_LOG, 'a') as f:
-                f.write(f"{datetime.datetime.now().isoformat()} | Daily brief executed\n")
-        else:
-            print(f"[{datetime.datetime.now()}] Daily brief failed: {result.stderr}")
+                f.write(entry)
+            return True
+        print(f"[{now}] Daily brief failed: {err.getvalue()}")
     except Exception as e:
         print(f"[{datetime.datetime.now()}] Error running daily brief: {e}")
+    return False
+
+def load_last_run_date():
+    """Date of the last successful daily run, or None."""
+    try:
+        with open(TIMER_STATE, 'r', encoding='utf-8') as f:
+            return datetime.date.fromisoformat(json.load(f)["last_run_date"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+def save_last_run_date(day):
+    TIMER_STATE.parent.mkdir(parents=True, exist_ok=True)
+    with open(TIMER_STATE, 'w', encoding='utf-8') as f:
+        json.dump({"last_run_date": day.isoformat()}, f)
 
 def generate_weekly_tape():
     """Generate weekly compression tape."""
     # Simplified: run a command or create a file
-    tape_file = SCRIPT_DIR / "reports" / f"compression_tape_{datetime.date.today()}.md"
+    today = datetime.date.today()
+    tape_file = SCRIPT_DIR / "reports" / f"compression_tape_{today}.md"
     with open(tape_file, 'w') as f:
-        f.write(f"# Compression Tape {datetime.date.today()}\n\nWeekly summary placeholder.\n")
+        f.write(f"# Compression Tape {today}\n\nWeekly summary placeholder.\n")
     print(f"[{datetime.datetime.now()}] Weekly tape generated: {tape_file}")
 
+def _next_fire(now, last_run_date=None):
+    """
+    When the daily run is next due: ``now`` if today's 06:00 has passed and
+    today hasn't run yet (e.g. after a restart at 06:05), otherwise the next
+    06:00 local time.
+    """
+    today6 = now.replace(hour=6, minute=0, second=0, microsecond=0)
+    if now < today6:
+        return today6
+    if last_run_date != now.date():
+        return now
+    return today6 + datetime.timedelta(days=1)
+
 def main():
-    last_run = None
-    last_tape = datetime.date.today()
+    # The tape goes with the day's run, so a Monday restart before the
+    # run still produces it.
+    last_tape = None
+    target = _next_fire(datetime.datetime.now(), load_last_run_date())
 
     while True:
+        # Sleep straight to the deadline; loop again if woken early.
         now = datetime.datetime.now()
-        current_date = now.date()
+        if now < target:
+            time.sleep(max(1.0, (target - now).total_seconds()))
+            continue
 
         # Run daily at 06:00
-        if now.hour == 6 and (last_run is None or last_run.date() != current_date):
-            run_daily_brief()
-            last_run = now
+        current_date = now.date()
+        if run_daily_brief():
+            save_last_run_date(current_date)
 
         # Generate weekly tape on Monday
         if current_date.weekday() == 0 and last_tape != current_date:
             generate_weekly_tape()
             last_tape = current_date
 
-        # Sleep for 1 hour
-        time.sleep(3600)
+        # A failed run waits for the next 06:00, as it always has.
+        target = _next_fire(datetime.datetime.now(), current_date)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -19,8 +19,16 @@ Responsibilities
 
 import sys
 import json
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 from pathlib import Path
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Dict, Iterable
+
+try:
+    import orjson
+except Exception:  # optional: stdlib json is the fallback
+    orjson = None
 
 # ---------------------------------------------------------------------------
 # Make sure project root and readers/ are on sys.path
@@ -54,51 +62,107 @@ from core.config import get_config
 # ---------------------------------------------------------------------------
 
 
+def _encode_payload(payload: dict) -> bytes:
+    """Indented UTF-8 JSON for the live feed; orjson when it's installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # e.g. an int wider than 64 bits; let json handle it
+    return json.dumps(payload, indent=2).encode("utf-8")
+
+
+# Bump when the mirror's template or FX output changes without a change to
+# mirror_builder.py itself, so the next cycle rebuilds.
+MIRROR_DIGEST_VERSION = 1
+
+
+def _stat_key(path: Path) -> Optional[list]:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _mirror_inputs(catalog_path: Path) -> list:
+    """
+    Files besides the payload that build_mirror's output depends on. The
+    docent cache is left out: the build itself writes it.
+    """
+    builder = getattr(mirror_builder, "__file__", None)
+    return [Path(builder) if builder else None, catalog_path]
+
+
+def _payload_digest(payload: dict, inputs: Iterable[Optional[Path]] = ()) -> str:
+    """
+    Hash of the payload minus its generated_at stamp (changes every cycle),
+    the mirror digest version, and the mtime/size of each of `inputs`.
+    """
+    stable = {k: v for k, v in payload.items() if k != "generated_at"}
+    h = hashlib.blake2b(_encode_payload(stable), digest_size=8)
+    stats = [MIRROR_DIGEST_VERSION] + [_stat_key(p) if p else None for p in inputs]
+    h.update(json.dumps(stats).encode("utf-8"))
+    return h.hexdigest()
+
+
+def _fetch_public_stats() -> Optional[dict]:
+    """blockchain.info network stats, or None on a non-2xx reply."""
+    resp = requests.get("https://api.blockchain.info/stats?cors=true", timeout=5)
+    return resp.json() if resp.ok else None
+
+
 def build_network_snapshot(provider) -> dict:
     """Best-effort snapshot of network state for the live window.
 
     - Tries local node RPC first (difficulty, blocks, chain).
     - Then tries a public API for BTC/USD and hash rate.
     - Never raises; on failure returns {}.
+
+    The public API request is in flight while the node is queried, so the
+    snapshot costs max(RPC, HTTP) rather than their sum. The two RPC calls
+    stay on this thread: they share the node's single RPC connection.
     """
     snap: dict = {}
 
-    # 1) Try local node for difficulty / chain info
-    try:
-        info = provider.call("getblockchaininfo", []) if hasattr(provider, "call") else provider.rpc_call("getblockchaininfo")  # type: ignore[attr-defined]
-        if isinstance(info, dict):
-            snap["difficulty"] = info.get("difficulty")
-            snap["blocks"] = info.get("blocks")
-            snap["chain"] = info.get("chain")
-    except Exception as e:
-        print(f"[warn] getblockchaininfo failed for network snapshot: {e}")
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        public = ex.submit(_fetch_public_stats)
 
-    # 2) Try local node for network hash rate (if supported)
-    try:
-        hps = provider.call("getnetworkhashps", []) if hasattr(provider, "call") else provider.rpc_call("getnetworkhashps")  # type: ignore[attr-defined]
-        if isinstance(hps, (int, float)):
-            snap["network_hashps"] = hps
-    except Exception as e:
-        print(f"[warn] getnetworkhashps failed for network snapshot: {e}")
+        # 1) Try local node for difficulty / chain info
+        try:
+            info = provider.call("getblockchaininfo", []) if hasattr(provider, "call") else provider.rpc_call("getblockchaininfo")  # type: ignore[attr-defined]
+            if isinstance(info, dict):
+                snap["difficulty"] = info.get("difficulty")
+                snap["blocks"] = info.get("blocks")
+                snap["chain"] = info.get("chain")
+        except Exception as e:
+            print(f"[warn] getblockchaininfo failed for network snapshot: {e}")
 
-    # 3) Public API for BTC/USD & hash rate (blockchain.info)
-    try:
-        resp = requests.get("https://api.blockchain.info/stats?cors=true", timeout=5)
-        if resp.ok:
-            data = resp.json()
-            # API gives hash_rate in GH/s; convert to H/s if we want
-            if "hash_rate" in data and "network_hashps" not in snap:
-                try:
-                    ghps = float(data["hash_rate"])
-                    snap["network_hashps"] = ghps * 1e9
-                except Exception:
-                    pass
-            if "difficulty" in data and "difficulty" not in snap:
-                snap["difficulty"] = data["difficulty"]
-            if "market_price_usd" in data:
-                snap["btc_usd"] = data["market_price_usd"]
-    except Exception as e:
-        print(f"[warn] public network stats fetch failed: {e}")
+        # 2) Try local node for network hash rate (if supported)
+        try:
+            hps = provider.call("getnetworkhashps", []) if hasattr(provider, "call") else provider.rpc_call("getnetworkhashps")  # type: ignore[attr-defined]
+            if isinstance(hps, (int, float)):
+                snap["network_hashps"] = hps
+        except Exception as e:
+            print(f"[warn] getnetworkhashps failed for network snapshot: {e}")
+
+        # 3) Public API for BTC/USD & hash rate (blockchain.info); node values win
+        try:
+            data = public.result()
+            if data is not None:
+                # API gives hash_rate in GH/s; convert to H/s if we want
+                if "hash_rate" in data and "network_hashps" not in snap:
+                    try:
+                        ghps = float(data["hash_rate"])
+                        snap["network_hashps"] = ghps * 1e9
+                    except Exception:
+                        pass
+                if "difficulty" in data and "difficulty" not in snap:
+                    snap["difficulty"] = data["difficulty"]
+                if "market_price_usd" in data:
+                    snap["btc_usd"] = data["market_price_usd"]
+        except Exception as e:
+            print(f"[warn] public network stats fetch failed: {e}")
 
     return snap
 
@@ -144,9 +208,9 @@ def main() -> None:
 
     # Fetch blocks
     try:
-        blocks = list(provider.get_range(start_height, end_height))
+        blocks = list(provider.get_range_batched(start_height, end_height))
     except Exception as e:
-        print(f"[fatal] provider.get_range({start_height}, {end_height}) failed: {e}")
+        print(f"[fatal] provider.get_range_batched({start_height}, {end_height}) failed: {e}")
         sys.exit(1)
 
     if not blocks:
@@ -158,7 +222,8 @@ def main() -> None:
     # Run detectors -> signals (each Signal already contains the block stats you care about)
     signals, detector_state = detect_signals(blocks)
 
-    polyphonic_count = sum(1 for s in signals if getattr(s, "polyphonic", False))
+    # Signal is a dataclass with a bool polyphonic field: sum the flags in C.
+    polyphonic_count = sum(map(attrgetter("polyphonic"), signals))
     print(
         f"[info] Detected {len(signals)} signals "
         f"(polyphonic: {polyphonic_count}) in live window."
@@ -170,10 +235,7 @@ def main() -> None:
 
     # Persist live JSON feed
     try:
-        output_json_path.write_text(
-            json.dumps(payload, indent=2),
-            encoding="utf-8",
-        )
+        output_json_path.write_bytes(_encode_payload(payload))
         print(f"[ok] Wrote latest signals to {output_json_path}")
     except Exception as e:
         print(f"[error] Failed to write {output_json_path}: {e}")
@@ -192,12 +254,24 @@ def main() -> None:
     else:
         print("[info] No signals in this window; catalog not updated.")
 
-    # Rebuild MESSAGE_MIRROR.html via readers/mirror_builder.py
+    # Rebuild MESSAGE_MIRROR.html via readers/mirror_builder.py, unless the
+    # payload, builder and catalog are all as they were when the current
+    # mirror was built.
+    hash_path = mirror_html_path.with_name(".mirror_payload.hash")
+    payload_hash = _payload_digest(payload, _mirror_inputs(catalog_path))
     try:
-        mirror_builder.build_mirror(output_json_path, mirror_html_path)
-        print(f"[ok] Rebuilt MESSAGE_MIRROR at {mirror_html_path}")
-    except Exception as e:
-        print(f"[warn] Could not rebuild MESSAGE_MIRROR.html: {e}")
+        last_hash = hash_path.read_text(encoding="utf-8").strip()
+    except OSError:
+        last_hash = ""
+    if payload_hash == last_hash and mirror_html_path.exists():
+        print("[skip] mirror inputs unchanged; MESSAGE_MIRROR left as is")
+    else:
+        try:
+            mirror_builder.build_mirror(output_json_path, mirror_html_path)
+            print(f"[ok] Rebuilt MESSAGE_MIRROR at {mirror_html_path}")
+            hash_path.write_text(payload_hash, encoding="utf-8")
+        except Exception as e:
+            print(f"[warn] Could not rebuild MESSAGE_MIRROR.html: {e}")
 
     print("SOVEREIGN_EAR_V6 cycle complete.")
 
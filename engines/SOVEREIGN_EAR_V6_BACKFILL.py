@@ -14,26 +14,22 @@ Prune-aware historical "museum" builder for SovereignSignals V6.
 Safe to run repeatedly: it tracks progress in backfill_state.json.
 """
 
+import os
 import sys
 import json
 import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple
 
 ROOT = Path(__file__).resolve().parent.parent
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from sovereign_core.providers import LocalRPCProvider, RPC_URL  # type: ignore
+from sovereign_core.providers import LocalRPCProvider, get_shared_proxy  # type: ignore
 from sovereign_core.detectors import detect_signals  # type: ignore
 from sovereign_core.catalog import update_block_catalog  # type: ignore
 
-try:
-    # Only used here to read blockchaininfo / pruneheight.
-    from bitcoinrpc.authproxy import AuthServiceProxy  # type: ignore
-except Exception:  # pragma: no cover
-    AuthServiceProxy = None  # type: ignore
-
 
 def load_config(root: Path) -> Dict[str, Any]:
     cfg_path = root / "config.json"
@@ -56,20 +52,30 @@ def load_backfill_state(root: Path) -> Dict[str, Any]:
 
 
 def save_backfill_state(root: Path, state: Dict[str, Any]) -> None:
+    """
+    Write backfill_state.json atomically: a crash mid-write leaves the
+    previous state in place instead of a truncated file.
+    """
     state_path = root / "backfill_state.json"
-    state_path.write_text(json.dumps(state, indent=2), encoding="utf-8")
+    tmp_path = state_path.with_suffix(".json.tmp")
+    with tmp_path.open("w", encoding="utf-8") as f:
+        f.write(json.dumps(state, indent=2))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, state_path)
+
+
+def fetch_chunk(provider: LocalRPCProvider, start: int, end: int, batch: int) -> List[Any]:
+    """All SimpleBlocks for [start, end], via batched JSON-RPC."""
+    return list(provider.get_range_batched(start, end, batch=batch))
 
 
 def get_blockchain_info() -> Dict[str, Any]:
     """
-    Lightweight helper to query getblockchaininfo from the same RPC URL
-    that LocalRPCProvider uses. If RPC is unavailable, we raise a clear error.
+    Lightweight helper to query getblockchaininfo over the same shared
+    connection that LocalRPCProvider uses.
     """
-    if AuthServiceProxy is None:
-        raise RuntimeError("bitcoinrpc.authproxy.AuthServiceProxy not available")
-
-    rpc = AuthServiceProxy(RPC_URL)  # type: ignore
-    return rpc.getblockchaininfo()
+    return get_shared_proxy().getblockchaininfo()
 
 
 def main() -> None:
@@ -80,6 +86,9 @@ def main() -> None:
     cfg_backfill_start = int(cfg.get("backfill_start_height", 1))
     backfill_chunk_size = int(cfg.get("backfill_chunk_size", 500))
     backfill_sleep_seconds = int(cfg.get("backfill_sleep_seconds", 5))
+    # Heights per JSON-RPC batch POST. getblock(verbosity=2) replies run to
+    # megabytes per block, so this stays well below the chunk size.
+    backfill_rpc_batch = int(cfg.get("backfill_rpc_batch", 50))
     window_size = int(cfg.get("window_size", 500))
     catalog_path = project_root / cfg.get("block_catalog_path", "block_catalog.jsonl")
 
@@ -121,6 +130,7 @@ def main() -> None:
     print(f"   Last processed height   : {last_processed:,}")
     print(f"   Catalog path            : {catalog_path}")
     print(f"   Chunk size              : {backfill_chunk_size}")
+    print(f"   RPC batch size          : {backfill_rpc_batch}")
     print(f"   Sleep between chunks    : {backfill_sleep_seconds}s")
     print()
 
@@ -129,63 +139,89 @@ def main() -> None:
         print("   You can safely stop this script; the museum is up to date for the available chain.")
         return
 
-    while True:
-        if last_processed >= max_backfill_height:
-            print("   Backfill complete — no more historical blocks below live region.")
-            break
-
-        # Next chunk boundaries, clamped to [effective_backfill_start, max_backfill_height]
-        chunk_start = max(effective_backfill_start, last_processed + 1)
-        chunk_end = min(chunk_start + backfill_chunk_size - 1, max_backfill_height)
-
-        if chunk_start > chunk_end:
-            print("   Backfill complete (chunk_start > chunk_end).")
-            break
-
-        print(f"   Processing chunk: {chunk_start:,} → {chunk_end:,}")
-
-        try:
-            blocks = list(provider.get_range(chunk_start, chunk_end))
-        except Exception as e:
-            print(f"   [error] provider failure in range {chunk_start}–{chunk_end}: {e}")
-            print(f"   Sleeping {backfill_sleep_seconds} seconds and retrying...")
-            time.sleep(backfill_sleep_seconds)
-            continue
-
-        if not blocks:
-            print("   [warn] provider returned no blocks; skipping this chunk.")
-            last_processed = chunk_end  # Mark as processed to move on
+    # One background thread fetches chunk N+1 over RPC while this thread runs
+    # detectors and writes the catalog for chunk N. Only that thread touches
+    # `provider` (AuthServiceProxy is not thread-safe). Detectors are pure
+    # per-block CPU work; a process pool runs each chunk's 50-block runs in
+    # parallel (see detect_signals). Both pools are shut down on any exit,
+    # including Ctrl-C or an error mid-chunk.
+    pending: Optional[Tuple[int, int, Future]] = None
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as detector_pool, \
+            ThreadPoolExecutor(max_workers=1) as fetcher:
+        while True:
+            if last_processed >= max_backfill_height:
+                print("   Backfill complete — no more historical blocks below live region.")
+                break
+
+            # Next chunk boundaries, clamped to [effective_backfill_start, max_backfill_height]
+            chunk_start = max(effective_backfill_start, last_processed + 1)
+            chunk_end = min(chunk_start + backfill_chunk_size - 1, max_backfill_height)
+
+            if chunk_start > chunk_end:
+                print("   Backfill complete (chunk_start > chunk_end).")
+                break
+
+            print(f"   Processing chunk: {chunk_start:,} → {chunk_end:,}")
+
+            if pending is None or pending[:2] != (chunk_start, chunk_end):
+                pending = (
+                    chunk_start,
+                    chunk_end,
+                    fetcher.submit(fetch_chunk, provider, chunk_start, chunk_end, backfill_rpc_batch),
+                )
+            future, pending = pending[2], None
+            try:
+                blocks = future.result()
+            except Exception as e:
+                print(f"   [error] provider failure in range {chunk_start}–{chunk_end}: {e}")
+                print(f"   Sleeping {backfill_sleep_seconds} seconds and retrying...")
+                time.sleep(backfill_sleep_seconds)
+                continue
+
+            if not blocks:
+                print("   [warn] provider returned no blocks; skipping this chunk.")
+                last_processed = chunk_end  # Mark as processed to move on
+                state["last_processed_height"] = last_processed
+                save_backfill_state(project_root, state)
+                continue
+
+            # Prefetch the next chunk while this one is detected and written.
+            next_start = chunk_end + 1
+            next_end = min(next_start + backfill_chunk_size - 1, max_backfill_height)
+            if next_start <= next_end:
+                pending = (
+                    next_start,
+                    next_end,
+                    fetcher.submit(fetch_chunk, provider, next_start, next_end, backfill_rpc_batch),
+                )
+
+            print(f"   Retrieved {len(blocks)} blocks; running detectors...")
+            signals, _detector_state = detect_signals(blocks, executor=detector_pool)
+
+            polyphonic_count = sum(1 for s in signals if getattr(s, "polyphonic", False))
+            print(
+                f"   Signals in this chunk: {len(signals)} "
+                f"(polyphonic: {polyphonic_count})"
+            )
+
+            # Append directly to the main catalog (museum)
+            entries = [s.to_dict() for s in signals]
+            if entries:
+                update_block_catalog(catalog_path, entries)
+                print(f"   Appended {len(entries)} records to catalog")
+
+            last_processed = chunk_end
             state["last_processed_height"] = last_processed
             save_backfill_state(project_root, state)
-            continue
-
-        print(f"   Retrieved {len(blocks)} blocks; running detectors...")
-        signals, _detector_state = detect_signals(blocks)
-
-        polyphonic_count = sum(1 for s in signals if getattr(s, "polyphonic", False))
-        print(
-            f"   Signals in this chunk: {len(signals)} "
-            f"(polyphonic: {polyphonic_count})"
-        )
-
-        # Append directly to the main catalog (museum)
-        entries = [s.to_dict() for s in signals]
-        if entries:
-            update_block_catalog(catalog_path, entries)
-            print(f"   Appended {len(entries)} records to catalog")
-
-        last_processed = chunk_end
-        state["last_processed_height"] = last_processed
-        save_backfill_state(project_root, state)
-        print(
-            f"   Updated backfill_state.json (last_processed_height = "
-            f"{last_processed:,})"
-        )
-
-        # Friendly pause to avoid hammering the node
-        print(f"   Sleeping {backfill_sleep_seconds} seconds before next chunk...")
-        time.sleep(backfill_sleep_seconds)
-        print()
+            print(
+                f"   Updated backfill_state.json (last_processed_height = "
+                f"{last_processed:,})"
+            )
+
+            # Friendly pause to avoid hammering the node
+            print(f"   Sleeping {backfill_sleep_seconds} seconds before next chunk...")
+            time.sleep(backfill_sleep_seconds)
+            print()
 
     print("SOVEREIGN_EAR_V6_BACKFILL complete.")
 
@@ -7,12 +7,10 @@ ROOT = Path(__file__).resolve().parent
 if str(ROOT.parent) not in sys.path:
     sys.path.insert(0, str(ROOT.parent))
 
-from bitcoinrpc.authproxy import AuthServiceProxy  # type: ignore
-
 from sovereign_core.detectors import detect_signals
 from sovereign_core.narrative import make_block_story, classify_tags
 from sovereign_core.catalog import update_block_catalog
-from sovereign_core.providers import SimpleBlock, RPC_URL
+from sovereign_core.providers import SimpleBlock, get_shared_proxy
 
 CATALOG = ROOT.parent / "block_catalog.jsonl"
 
@@ -22,7 +20,7 @@ def main(block_hash: str) -> None:
     with log_path.open("a", encoding="utf-8") as log:
         log.write(f"Starting extraction for {block_hash}\n")
         try:
-            rpc = AuthServiceProxy(RPC_URL)
+            rpc = get_shared_proxy()
             blk = rpc.getblock(block_hash, 2)
             h = blk["height"]
             log.write(f"Fetched block {h}\n")
@@ -30,20 +28,22 @@ def main(block_hash: str) -> None:
             cb_hex = blk["tx"][0]["vin"][0].get("coinbase", "") or ""
             cb = bytes.fromhex(cb_hex) if cb_hex else b""
 
-            total_out = 0.0
-            largest = 0.0
+            # One pass over every vout: block total, coinbase output and the
+            # largest non-coinbase tx. Sums start at int 0 so they stay in
+            # whatever type the RPC layer returns (Decimal from authproxy).
+            total_out = 0
+            largest = 0
+            cb_out = 0
             for i, tx in enumerate(blk["tx"]):
-                vout_sum = sum(v["value"] for v in tx.get("vout", []))
+                vout_sum = 0
+                for v in tx["vout"]:
+                    vout_sum += v["value"]
                 total_out += vout_sum
-                if i > 0 and vout_sum > largest:
+                if i == 0:
+                    cb_out = vout_sum
+                elif vout_sum > largest:
                     largest = vout_sum
-
-            try:
-                cb_out = sum(v["value"] for v in blk["tx"][0].get("vout", []))
-                total_non_cb = total_out - cb_out
-                fee_est = max(0.0, cb_out - total_non_cb)
-            except Exception:
-                fee_est = 0.0
+            fee_est = max(0, cb_out - (total_out - cb_out))
 
             sblock = SimpleBlock(
                 height=h,
@@ -52,9 +52,9 @@ def main(block_hash: str) -> None:
                 coinbase_script=cb,
                 pool_hint="unknown",
                 tx_count=len(blk["tx"]),
-                total_output_btc=total_out,
-                largest_tx_btc=largest,
-                total_fee_btc=fee_est,
+                total_output_btc=float(total_out),
+                largest_tx_btc=float(largest),
+                total_fee_btc=float(fee_est),
             )
 
             signals, _ = detect_signals([sblock])
@@ -1,15 +1,21 @@
+import re
+
 from utils.price_corridor_engine import CorridorSnapshot
 
+_WEAK_RE = re.compile(r"could|maybe|suggests|might", re.IGNORECASE)
+_REQUIRED_RE = re.compile(
+    r"impossible|bias|cannot|forces|eliminates|structurally illegal|no viable off-ramp",
+    re.IGNORECASE,
+)
+
 def render_price_corridor(snapshot: CorridorSnapshot):
     # Enforce vocabulary constraints
-    weak_verbs = ["could", "maybe", "suggests", "might"]
-    for verb in weak_verbs:
-        if verb in snapshot.inevitability.lower():
-            raise ValueError(f"WEAK LANGUAGE DETECTED in inevitability: {verb}")
+    weak = _WEAK_RE.search(snapshot.inevitability)
+    if weak:
+        raise ValueError(f"WEAK LANGUAGE DETECTED in inevitability: {weak.group(0).lower()}")
 
     # Ensure inevitability has required verbs
-    required = ["impossible", "bias", "cannot", "forces", "eliminates", "structurally illegal", "no viable off-ramp"]
-    if not any(req in snapshot.inevitability.lower() for req in required):
+    if not _REQUIRED_RE.search(snapshot.inevitability):
         raise ValueError("V6 Corridor requires inevitability verbs in sentence.")
 
     lines = []
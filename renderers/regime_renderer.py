@@ -1,16 +1,18 @@
+import re
 from typing import Optional, Dict
 from utils.regime_tracker import RegimeSnapshot
 from core.brief_renderer import assert_conviction
 
+_WEAK_RE = re.compile(r"might|looks|appears", re.IGNORECASE)
+_REQUIRED_RE = re.compile(r"cannot|forces|eliminates|locks|guaranteed|pulled|decays", re.IGNORECASE)
+
 def render_regime_section(regime_snapshot: RegimeSnapshot, horizon_state: Optional[Dict] = None) -> str:
     # Enforce language constraints
-    weak_words = ["might", "looks", "appears"]
-    if any(word in regime_snapshot.inevitability.lower() for word in weak_words):
+    if _WEAK_RE.search(regime_snapshot.inevitability):
         raise ValueError("WEAK LANGUAGE DETECTED in regime inevitability")
 
     # Ensure inevitability has required verbs
-    required = ["cannot", "forces", "eliminates", "locks", "guaranteed", "pulled", "decays"]
-    if not any(req in regime_snapshot.inevitability.lower() for req in required):
+    if not _REQUIRED_RE.search(regime_snapshot.inevitability):
         raise ValueError("Regime inevitability requires causal verbs")
 
     lines = []
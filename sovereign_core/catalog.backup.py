@@ -1,10 +1,30 @@
 from __future__ import annotations
 
 import json
+import re
 from dataclasses import dataclass, asdict
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
+try:
+    import orjson
+except Exception:  # optional: stdlib json is the fallback
+    orjson = None
+
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _dump_line(obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE)
+        except TypeError:  # e.g. an int wider than 64 bits
+            return (json.dumps(obj, sort_keys=True) + "\n").encode("utf-8")
+else:
+    _loads = json.loads
+
+    def _dump_line(obj: Any) -> bytes:
+        return (json.dumps(obj, sort_keys=True) + "\n").encode("utf-8")
+
 try:
     # Docent / narrative helpers we already wired for the block plaques.
     from sovereign_core.narrative import make_block_story, make_curator_tags
@@ -215,19 +235,31 @@ def build_catalog_entry(sig: Dict[str, Any]) -> CatalogEntry:
     )
 
 
+# Every "height" key on the raw line, with its digits when the value is a
+# plain integer (empty otherwise). The look-behind skips an escaped \"height\" inside a
+# story/hook string. Only a line with exactly one such key can be read off
+# the raw bytes: with sorted keys a nested {"height": ...} (e.g. under
+# "anchor" or "coinbase") can come before the top-level one.
+_HEIGHT_RE = re.compile(rb'(?<!\\)"height"\s*:\s*(\d+(?=\s*[,}])|)')
+
+
 def _load_existing_heights(catalog_path: Path) -> Set[int]:
     heights: Set[int] = set()
     if not catalog_path.exists():
         return heights
     try:
-        with catalog_path.open("r", encoding="utf-8") as fh:
+        with catalog_path.open("rb") as fh:
             for line in fh:
                 line = line.strip()
                 if not line:
                     continue
+                found = _HEIGHT_RE.findall(line)
+                if len(found) == 1 and found[0]:
+                    heights.add(int(found[0]))
+                    continue
                 try:
-                    obj = json.loads(line)
-                except json.JSONDecodeError:
+                    obj = _loads(line)
+                except ValueError:  # json / orjson JSONDecodeError
                     continue
                 h = obj.get("height")
                 try:
@@ -271,11 +303,14 @@ def append_block_catalog_entries(
     if not new_entries:
         return 0
 
-    with catalog_path.open("a", encoding="utf-8") as fh:
-        for entry in new_entries:
-            obj = asdict(entry)
-            # Tiny bit of provenance never hurts.
-            obj["_source"] = source
-            fh.write(json.dumps(obj, sort_keys=True) + "\n")
+    lines = []
+    for entry in new_entries:
+        obj = asdict(entry)
+        # Tiny bit of provenance never hurts.
+        obj["_source"] = source
+        lines.append(_dump_line(obj))
+
+    with catalog_path.open("ab") as fh:
+        fh.write(b"".join(lines))
 
     return len(new_entries)
@@ -1,38 +1,89 @@
 from __future__ import annotations
-import json, hashlib
+import json
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Set, Tuple, Union
 from core.era import get_era
 
+try:
+    import orjson
+except Exception:  # optional: stdlib json is the fallback
+    orjson = None
+
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _dump_line(obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+        except TypeError:  # e.g. an int wider than 64 bits
+            return (json.dumps(obj, sort_keys=False) + "\n").encode("utf-8")
+else:
+    _loads = json.loads
+
+    def _dump_line(obj: Any) -> bytes:
+        return (json.dumps(obj, sort_keys=False) + "\n").encode("utf-8")
+
 ROOT = Path(__file__).resolve().parent.parent
 CATALOG_PATH = ROOT / "block_catalog.jsonl"
 
-def _entry_key(sig: Dict[str, Any]) -> str:
-    sample = (sig.get("sample_hex") or "")[:32]
-    key = f'{sig["height"]}:{sample}'
-    return hashlib.sha256(key.encode()).hexdigest()[:12]
+EntryKey = Tuple[Union[int, str], str]  # (height, first 32 chars of sample_hex)
+
+# Entry keys already in each catalog file, with the (mtime_ns, size) they were
+# valid for. The live engine and the backfill both append to the catalog, so a
+# stat mismatch means another writer got there first and the set is reloaded.
+_KEY_INDEX: Dict[Path, Tuple[Tuple[int, int], Set[EntryKey]]] = {}
+
+def _entry_key(sig: Dict[str, Any]) -> EntryKey:
+    h = sig.get("height")
+    try:
+        h = int(h)
+    except (TypeError, ValueError):
+        h = str(h)  # missing / non-numeric height: dedupe on its text, as before
+    return h, (sig.get("sample_hex") or "")[:32]
+
+def _stat_sig(path: Path) -> Tuple[int, int]:
+    st = path.stat()
+    return st.st_mtime_ns, st.st_size
+
+def _load_existing_keys(path: Path) -> Set[EntryKey]:
+    existing = set()
+    with path.open("rb") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                try:
+                    obj = _loads(line)
+                    existing.add(_entry_key(obj))
+                except: pass
+    return existing
+
+def _existing_keys(path: Path) -> Set[EntryKey]:
+    if not path.exists():
+        _KEY_INDEX.pop(path, None)
+        return set()
+    sig = _stat_sig(path)
+    cached = _KEY_INDEX.get(path)
+    if cached is not None and cached[0] == sig:
+        return cached[1]
+    existing = _load_existing_keys(path)
+    _KEY_INDEX[path] = (sig, existing)
+    return existing
 
 def update_block_catalog(catalog_path: Path, signals: List[Dict[str, Any]]) -> int:
     if not signals: return 0
     catalog_path = catalog_path.expanduser().resolve()
     catalog_path.parent.mkdir(parents=True, exist_ok=True)
-    existing = set()
-    if catalog_path.exists():
-        with catalog_path.open("r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    try:
-                        obj = json.loads(line)
-                        existing.add(_entry_key(obj))
-                    except: pass
+    existing = _existing_keys(catalog_path)
+    total_before = len(existing)
     new_sigs = [s for s in signals if _entry_key(s) not in existing]
     if new_sigs:
         for s in new_sigs:
             if "era_slug" not in s:
                 s["era_slug"] = get_era(s.get("height"), s.get("timestamp"))
-        with catalog_path.open("a", encoding="utf-8") as f:
-            for s in new_sigs:
-                f.write(json.dumps(s, sort_keys=False) + "\n")
-        print(f"[Catalog] +{len(new_sigs)} new blocks → ~{len(existing)+len(new_sigs):,} total")
+        payload = b"".join(_dump_line(s) for s in new_sigs)
+        with catalog_path.open("ab") as f:
+            f.write(payload)
+        existing.update(_entry_key(s) for s in new_sigs)
+        _KEY_INDEX[catalog_path] = (_stat_sig(catalog_path), existing)
+        print(f"[Catalog] +{len(new_sigs)} new blocks → ~{total_before+len(new_sigs):,} total")
     return len(new_sigs)
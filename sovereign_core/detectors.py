@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 from collections import deque
-from typing import Dict, List, Tuple
+from concurrent.futures import Executor
+from operator import attrgetter
+from typing import Dict, List, Optional, Tuple
 
 from .entropy import shannon_entropy, compression_ratio
 from .providers import SimpleBlock
@@ -152,63 +154,40 @@ def _analyze_network_health(block: SimpleBlock, entropy: float, complexity: floa
     return health
 
 
-def detect_signals(blocks: List[SimpleBlock]) -> Tuple[List[Signal], DetectorState]:
-    state = DetectorState()
+def _detect_run(
+    blocks: List[SimpleBlock], prev_timestamp: Optional[int] = None
+) -> List[Tuple[Signal, Dict]]:
+    """
+    Signals for a height-sorted run of blocks, each paired with the sample
+    detect_signals records in DetectorState. `prev_timestamp` is the block
+    just before blocks[0], when the run is a slice of a longer window.
 
-    stats: List[Dict] = []
+    Pure function of its arguments, so runs can go to worker processes.
+    """
+    out: List[Tuple[Signal, Dict]] = []
     for b in blocks:
+        # Coinbase analysis
         cb = b.coinbase_script
         cb_entropy = shannon_entropy(cb)
         cb_complexity = compression_ratio(cb)
+        quadrant = classify_quadrant(cb_entropy, cb_complexity)
 
+        # Header tail analysis
         tail_bytes = bytes.fromhex(b.block_hash[-32:]) if b.block_hash else b""
         tail_entropy = shannon_entropy(tail_bytes)
         tail_complexity = compression_ratio(tail_bytes)
 
-        # Additional analysis: script patterns
-        script_patterns = _analyze_script_patterns(cb)
-
-        stats.append(
-            {
-                "block": b,
-                "cb_entropy": cb_entropy,
-                "cb_complexity": cb_complexity,
-                "tail_entropy": tail_entropy,
-                "tail_complexity": tail_complexity,
-                "script_patterns": script_patterns,
-            }
-        )
-
-    if not stats:
-        return [], state
-
-    # Sort by height for time-series analysis
-    stats.sort(key=lambda s: s["block"].height)
-
-    signals: List[Signal] = []
-    for i, stat in enumerate(stats):
-        b = stat["block"]
-
-        # Coinbase analysis
-        cb_entropy = stat["cb_entropy"]
-        cb_complexity = stat["cb_complexity"]
-        quadrant = classify_quadrant(cb_entropy, cb_complexity)
-
-        # Header tail analysis
-        tail_entropy = stat["tail_entropy"]
-        tail_complexity = stat["tail_complexity"]
-
         # Script pattern analysis
-        script_patterns = stat["script_patterns"]
+        script_patterns = _analyze_script_patterns(cb)
 
         # Time delta analysis (compare with previous)
         time_delta_weird = False
-        if i > 0:
-            prev_timestamp = stats[i-1]["block"].timestamp
+        if prev_timestamp is not None:
             current_timestamp = b.timestamp
             expected_delta = 600  # 10 minutes
             actual_delta = current_timestamp - prev_timestamp
             time_delta_weird = abs(actual_delta - expected_delta) > 120  # >2 min deviation
+        prev_timestamp = b.timestamp
 
         # Enhanced channels
         channels = Channels(
@@ -295,19 +274,48 @@ def detect_signals(blocks: List[SimpleBlock]) -> Tuple[List[Signal], DetectorSta
             polyphony_score=polyphony_score,
         )
 
-        signals.append(signal)
+        sample = {
+            "height": b.height,
+            "entropy": cb_entropy,
+            "complexity": cb_complexity,
+            "polyphonic": polyphonic,
+            "era": era,
+            "pool": enhanced_pool,
+        }
+        out.append((signal, sample))
 
-        # Update state with more data
-        state.recent_samples.append(
-            {
-                "height": b.height,
-                "entropy": cb_entropy,
-                "complexity": cb_complexity,
-                "polyphonic": polyphonic,
-                "era": era,
-                "pool": enhanced_pool,
-            }
-        )
-        state.last_timestamp = b.timestamp
+    return out
+
+
+def detect_signals(
+    blocks: List[SimpleBlock],
+    executor: Optional[Executor] = None,
+    chunk_size: int = 50,
+) -> Tuple[List[Signal], DetectorState]:
+    """
+    Run the detector pipeline over `blocks` (any order; processed by height).
+
+    With an `executor` (e.g. a ProcessPoolExecutor), the height-sorted window
+    is split into runs of `chunk_size` blocks that are detected in parallel;
+    each run is handed the timestamp of the block before it, so the result is
+    identical to the serial path.
+    """
+    state = DetectorState()
+
+    # Sort by height for time-series analysis
+    ordered = sorted(blocks, key=attrgetter("height"))
+    n = len(ordered)
+    if executor is None or n <= chunk_size:
+        results = _detect_run(ordered)
+    else:
+        runs = [ordered[i:i + chunk_size] for i in range(0, n, chunk_size)]
+        prevs = [None] + [ordered[i - 1].timestamp for i in range(chunk_size, n, chunk_size)]
+        results = [r for run in executor.map(_detect_run, runs, prevs) for r in run]
+
+    signals: List[Signal] = []
+    for signal, sample in results:
+        signals.append(signal)
+        state.recent_samples.append(sample)
+        state.last_timestamp = signal.timestamp
 
     return signals, state
@@ -25,6 +25,22 @@ RPC_PORT = int(os.getenv("SOVEREIGN_RPC_PORT", "8332"))
 
 RPC_URL = f"http://{RPC_USER}:{RPC_PASSWORD}@{RPC_HOST}:{RPC_PORT}"
 
+_SHARED_PROXY: AuthServiceProxy | None = None
+
+
+def get_shared_proxy() -> AuthServiceProxy:
+    """
+    Process-wide AuthServiceProxy for RPC_URL, created on first use.
+
+    The proxy keeps its HTTP connection open between calls, so sharing one
+    saves a TCP connect + auth round-trip per caller. It is not thread-safe:
+    use it from one thread at a time.
+    """
+    global _SHARED_PROXY
+    if _SHARED_PROXY is None:
+        _SHARED_PROXY = AuthServiceProxy(RPC_URL)
+    return _SHARED_PROXY
+
 
 @dataclass
 class SimpleBlock:
@@ -53,6 +69,11 @@ class BlockProvider:
     def get_range(self, start_height: int, end_height: int) -> Iterable[SimpleBlock]:
         raise NotImplementedError
 
+    def get_range_batched(
+        self, start_height: int, end_height: int, batch: int = 50
+    ) -> Iterable[SimpleBlock]:
+        return self.get_range(start_height, end_height)
+
 
 class LocalRPCProvider(BlockProvider):
     """
@@ -75,7 +96,7 @@ class LocalRPCProvider(BlockProvider):
     """
 
     def __init__(self) -> None:
-        self._rpc = AuthServiceProxy(RPC_URL)
+        self._rpc = get_shared_proxy()
 
     # --- Core RPC helpers ----------------------------------------------------
 
@@ -99,13 +120,69 @@ class LocalRPCProvider(BlockProvider):
             return "Binance Pool"
         return "unknown"
 
-    def get_range(self, start_height: int, end_height: int):
+    def _to_simple_block(self, h: int, hsh: str, blk: dict) -> SimpleBlock:
         """
-        Yield SimpleBlock objects for the inclusive height range.
+        Reduce a verbosity=2 getblock result to a SimpleBlock.
 
         Uses Decimal internally for all BTC math and converts to float only
         when populating SimpleBlock.
         """
+        cb_hex = blk["tx"][0]["vin"][0].get("coinbase", "") or ""
+        coinbase_bytes = bytes.fromhex(cb_hex) if cb_hex else b""
+
+        pool_hint = self._decode_pool_hint(coinbase_bytes)
+
+        txs = blk["tx"]
+        tx_count = len(txs)
+
+        total_out_dec: Decimal = Decimal("0")
+        largest_dec: Decimal = Decimal("0")
+
+        # Sum vout values as Decimal
+        for i, tx in enumerate(txs):
+            vout_sum_dec = sum(
+                Decimal(str(v["value"]))
+                for v in tx.get("vout", [])
+            )
+            total_out_dec += vout_sum_dec
+            if i > 0 and vout_sum_dec > largest_dec:
+                largest_dec = vout_sum_dec
+
+        # Very rough fee estimate (all Decimal)
+        try:
+            cb_out_dec = sum(
+                Decimal(str(v["value"]))
+                for v in txs[0].get("vout", [])
+            )
+            total_non_cb_dec = total_out_dec - cb_out_dec
+            fee_est_dec = cb_out_dec - total_non_cb_dec
+            if fee_est_dec < Decimal("0"):
+                fee_est_dec = Decimal("0")
+        except Exception:
+            fee_est_dec = Decimal("0")
+
+        # Convert to float for the dataclass
+        total_out = float(total_out_dec)
+        largest = float(largest_dec)
+        fee_est = float(fee_est_dec)
+
+        return SimpleBlock(
+            height=h,
+            timestamp=int(blk["time"]),
+            block_hash=str(hsh),
+            coinbase_script=coinbase_bytes,
+            pool_hint=pool_hint,
+            tx_count=tx_count,
+            total_output_btc=total_out,
+            largest_tx_btc=largest,
+            total_fee_btc=fee_est,
+        )
+
+    def get_range(self, start_height: int, end_height: int):
+        """
+        Yield SimpleBlock objects for the inclusive height range, one
+        getblockhash + getblock round-trip per height.
+        """
         start = max(1, int(start_height))
         end = int(end_height)
         if end < start:
@@ -115,60 +192,43 @@ class LocalRPCProvider(BlockProvider):
             try:
                 hsh = self._rpc.getblockhash(h)
                 blk = self._rpc.getblock(hsh, 2)  # verbosity=2 => decoded txs
-
-                cb_hex = blk["tx"][0]["vin"][0].get("coinbase", "") or ""
-                coinbase_bytes = bytes.fromhex(cb_hex) if cb_hex else b""
-
-                pool_hint = self._decode_pool_hint(coinbase_bytes)
-
-                txs = blk["tx"]
-                tx_count = len(txs)
-
-                total_out_dec: Decimal = Decimal("0")
-                largest_dec: Decimal = Decimal("0")
-
-                # Sum vout values as Decimal
-                for i, tx in enumerate(txs):
-                    vout_sum_dec = sum(
-                        Decimal(str(v["value"]))
-                        for v in tx.get("vout", [])
-                    )
-                    total_out_dec += vout_sum_dec
-                    if i > 0 and vout_sum_dec > largest_dec:
-                        largest_dec = vout_sum_dec
-
-                # Very rough fee estimate (all Decimal)
-                try:
-                    cb_out_dec = sum(
-                        Decimal(str(v["value"]))
-                        for v in txs[0].get("vout", [])
-                    )
-                    total_non_cb_dec = total_out_dec - cb_out_dec
-                    fee_est_dec = cb_out_dec - total_non_cb_dec
-                    if fee_est_dec < Decimal("0"):
-                        fee_est_dec = Decimal("0")
-                except Exception:
-                    fee_est_dec = Decimal("0")
-
-                # Convert to float for the dataclass
-                total_out = float(total_out_dec)
-                largest = float(largest_dec)
-                fee_est = float(fee_est_dec)
-
-                yield SimpleBlock(
-                    height=h,
-                    timestamp=int(blk["time"]),
-                    block_hash=str(hsh),
-                    coinbase_script=coinbase_bytes,
-                    pool_hint=pool_hint,
-                    tx_count=tx_count,
-                    total_output_btc=total_out,
-                    largest_tx_btc=largest,
-                    total_fee_btc=fee_est,
-                )
+                yield self._to_simple_block(h, hsh, blk)
             except JSONRPCException as e:
                 print(f"[LocalRPC] RPC error at height {h}: {e}")
                 continue
             except Exception as e:
                 print(f"[LocalRPC] Unexpected error at height {h}: {e}")
                 continue
+
+    def get_range_batched(self, start_height: int, end_height: int, batch: int = 50):
+        """
+        Like get_range, but coalesces `batch` heights into two JSON-RPC batch
+        requests (all getblockhash calls, then all getblock calls), so a
+        500-block window costs ~20 HTTP round-trips instead of ~1000.
+
+        If a batch fails as a whole, its heights are retried one by one via
+        get_range so per-height errors are still reported and skipped.
+        """
+        start = max(1, int(start_height))
+        end = int(end_height)
+        if end < start:
+            return
+
+        batch = max(1, int(batch))
+        for lo in range(start, end + 1, batch):
+            hi = min(end, lo + batch - 1)
+            heights = range(lo, hi + 1)
+            try:
+                hashes = self._rpc.batch_([["getblockhash", h] for h in heights])
+                blocks = self._rpc.batch_([["getblock", hsh, 2] for hsh in hashes])
+            except Exception as e:
+                print(f"[LocalRPC] Batch {lo}-{hi} failed ({e}); falling back to per-block RPC")
+                yield from self.get_range(lo, hi)
+                continue
+
+            for h, hsh, blk in zip(heights, hashes, blocks):
+                try:
+                    yield self._to_simple_block(h, hsh, blk)
+                except Exception as e:
+                    print(f"[LocalRPC] Unexpected error at height {h}: {e}")
+                    continue
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, asdict
+from operator import attrgetter
 from typing import Dict, Any, List
 
 
@@ -24,7 +25,7 @@ class Channels:
         return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class Signal:
     height: int
     pool: str
@@ -86,7 +87,7 @@ def build_payload(signals: List[Signal], tip_height: int, window_size: int) -> D
         "tip_height": tip_height,
         "window_size": window_size,
         "signal_count": len(signals),
-        "polyphonic_count": sum(1 for s in signals if s.polyphonic),
+        "polyphonic_count": sum(map(attrgetter("polyphonic"), signals)),
         "signals": [s.to_dict() for s in signals],
         "generated_at": __import__('datetime').datetime.now(__import__('datetime').timezone.utc).isoformat(),
     }
@@ -0,0 +1,20 @@
+import json
+
+from sovereign_core.catalog import update_block_catalog
+
+
+def _rows(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_catalog_dedupes_rows_with_bad_or_missing_height(tmp_path):
+    path = tmp_path / "block_catalog.jsonl"
+    sigs = [
+        {"height": 900000, "sample_hex": "ab" * 20},
+        {"height": "n/a", "sample_hex": "cd", "era_slug": "unknown"},
+        {"sample_hex": "ef"},
+    ]
+    assert update_block_catalog(path, [dict(s) for s in sigs]) == 3
+    assert update_block_catalog(path, [dict(s) for s in sigs]) == 0
+    assert update_block_catalog(path, [{"height": "900000", "sample_hex": "ab" * 20}]) == 0
+    assert len(_rows(path)) == 3
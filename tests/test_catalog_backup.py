@@ -0,0 +1,32 @@
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parent.parent
+
+
+def _load_catalog_backup():
+    path = REPO / "sovereign_core" / "catalog.backup.py"
+    spec = importlib.util.spec_from_file_location("catalog_backup_test", path)
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = mod  # dataclasses look the module up by name
+    spec.loader.exec_module(mod)
+    return mod
+
+
+catalog_backup = _load_catalog_backup()
+
+
+def test_existing_heights_use_the_top_level_key(tmp_path):
+    rows = [
+        # Sorted keys put the nested heights first.
+        {"anchor": {"height": 1}, "coinbase": {"height": 2}, "height": 900000},
+        {"height": 900001, "story": 'quotes \\"height\\": 5'},
+        {"height": 1e5},
+        {"height": "900002"},
+        {"height": None, "anchor": {"height": 3}},
+    ]
+    path = tmp_path / "block_catalog.jsonl"
+    path.write_text("".join(json.dumps(r, sort_keys=True) + "\n" for r in rows))
+    assert catalog_backup._load_existing_heights(path) == {900000, 900001, 100000, 900002}
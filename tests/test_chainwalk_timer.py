@@ -0,0 +1,41 @@
+import datetime
+import importlib.util
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parent.parent
+
+
+def _load_timer():
+    spec = importlib.util.spec_from_file_location("chainwalk_timer_test", REPO / "daemon" / "chainwalk_timer.py")
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+timer = _load_timer()
+DAY = datetime.date(2026, 10, 12)  # a Monday
+
+
+def _at(hour, minute=0):
+    return datetime.datetime.combine(DAY, datetime.time(hour, minute))
+
+
+def test_next_fire_before_six_waits_for_today():
+    assert timer._next_fire(_at(5, 30), None) == _at(6)
+
+
+def test_next_fire_after_six_runs_now_if_today_has_not_run():
+    # A restart at 06:05 must not lose the day.
+    assert timer._next_fire(_at(6, 5), DAY - datetime.timedelta(days=1)) == _at(6, 5)
+    assert timer._next_fire(_at(14), None) == _at(14)
+
+
+def test_next_fire_after_todays_run_waits_for_tomorrow():
+    assert timer._next_fire(_at(6, 5), DAY) == _at(6) + datetime.timedelta(days=1)
+
+
+def test_last_run_date_round_trips(tmp_path, monkeypatch):
+    monkeypatch.setattr(timer, "TIMER_STATE", tmp_path / "reports" / "chainwalk_timer_state.json")
+    assert timer.load_last_run_date() is None
+    timer.save_last_run_date(DAY)
+    assert timer.load_last_run_date() == DAY
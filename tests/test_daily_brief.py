@@ -0,0 +1,106 @@
+import importlib.util
+import json
+from pathlib import Path
+
+import pytest
+
+REPO = Path(__file__).resolve().parent.parent
+
+
+class _Stop(Exception):
+    pass
+
+
+def _load_brief():
+    spec = importlib.util.spec_from_file_location("chainwalk_daily_test", REPO / "CHAINWALK_DAILY_BRIEF.py")
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def test_run_resolves_regime_paths_from_root(tmp_path, monkeypatch):
+    """run() from another cwd still reads and writes the regime files under ROOT/reports."""
+    pytest.importorskip("requests")
+    brief = _load_brief()
+
+    import utils.memory_of_price as mop
+    import utils.regime_hamiltonian as rh
+    import utils.regime_tracker as rt
+
+    root = tmp_path / "root"
+    root.mkdir()
+    signals = [
+        {"height": 900000 + i, "entropy": 4.0, "complexity": 0.5, "fee_pressure": 0.3, "pool_name": "Foundry"}
+        for i in range(10)
+    ]
+    (root / "sovereign_signals_latest.json").write_text(json.dumps({"signals": signals}))
+    reports = root / "reports"
+    reports.mkdir()
+    (reports / "network_snapshot.json").write_bytes((REPO / "reports" / "network_snapshot.json").read_bytes())
+    monkeypatch.setattr(brief, "ROOT", root)
+    # The engines keep their own module-level report paths; keep them out of the repo.
+    monkeypatch.setattr(mop, "CTI_HISTORY_PATH", reports / "cti_history.jsonl")
+    monkeypatch.setattr(mop, "MEMORY_STATE_PATH", reports / "memory_of_price_state.json")
+    monkeypatch.setattr(rt, "REPORTS_DIR", reports)
+    monkeypatch.setattr(rt, "REGIME_STATE_PATH", reports / "regime_state.json")
+
+    seen = {}
+
+    def fake_horizon(**kwargs):
+        seen.update(kwargs)
+        raise _Stop
+
+    monkeypatch.setattr(rh, "compute_regime_horizon", fake_horizon)
+
+    cwd = tmp_path / "elsewhere"
+    cwd.mkdir()
+    monkeypatch.chdir(cwd)
+
+    assert brief.run() == 1  # stopped by fake_horizon
+    assert seen == {
+        "horizon_days": 7,
+        "regime_state_path": str(reports / "regime_state.json"),
+        "wavefunction_path": str(reports / "regime_wavefunction.jsonl"),
+        "out_state_path": str(reports / "regime_hamiltonian_state.json"),
+    }
+    assert (reports / "regime_wavefunction.jsonl").exists()
+    assert not (cwd / "reports").exists()
+
+
+def test_canonicalize_drops_none_alias():
+    brief = _load_brief()
+    s = {"height": 1, "entropy_h": None, "complexity_k": None}
+    brief._canonicalize_signal(s)
+    assert "entropy" not in s and "complexity" not in s
+    assert brief._window_totals([s]).entropy == 0
+
+
+def test_canonicalize_keeps_existing_canonical_value():
+    brief = _load_brief()
+    s = {"height": 1, "entropy": 3.5, "entropy_h": 4.0, "complexity": 0.6, "complexity_k": 0.7}
+    brief._canonicalize_signal(s)
+    assert s["entropy"] == 3.5 and s["complexity"] == 0.6
+    assert brief._window_totals([s]).entropy == 3.5
+
+
+def test_canonicalize_folds_lone_alias():
+    brief = _load_brief()
+    s = {"height": 1, "entropy_h": 4.0, "complexity_k": 0.7}
+    brief._canonicalize_signal(s)
+    assert s == {**s, "entropy": 4.0, "complexity": 0.7}
+    assert "entropy_h" not in s and "complexity_k" not in s
+
+
+def test_dumps_keeps_json_output_for_values_orjson_cannot_encode():
+    brief = _load_brief()
+    obj = {"cti": float("nan"), "big": 2 ** 70, "ok": 1.5}
+    assert brief._dumps(obj) == json.dumps(obj, ensure_ascii=False, indent=2)
+    assert json.loads(brief._dumps({"ok": 1.5})) == {"ok": 1.5}
+
+
+def test_dump_bytes_and_line_keep_json_output_for_nan():
+    brief = _load_brief()
+    obj = {"cti": float("inf"), "big": 2 ** 70}
+    assert brief._dump_bytes(obj) == json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    assert brief._dump_line(obj) == json.dumps(obj).encode("utf-8")
+    assert brief._loads(brief._dump_line(obj)) == obj
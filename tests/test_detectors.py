@@ -0,0 +1,44 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+pytest.importorskip("bitcoinrpc")
+
+from sovereign_core.detectors import detect_signals
+from sovereign_core.providers import SimpleBlock
+
+
+def _block(height, coinbase, pool_hint=""):
+    return SimpleBlock(
+        height=height,
+        timestamp=1_700_000_000 + height * 600,
+        block_hash=f"{height:064x}",
+        coinbase_script=coinbase,
+        pool_hint=pool_hint,
+        tx_count=2000,
+        total_output_btc=1000.0,
+        largest_tx_btc=10.0,
+        total_fee_btc=0.1,
+    )
+
+
+BLOCKS = [
+    _block(900_000, b"\x03mined by Foundry USA"),
+    _block(900_001, b"\x03/AntPool/"),
+    _block(900_002, b"\x03anonymous", pool_hint="unknown"),
+    _block(900_003, b"\x03/ViaBTC/"),
+]
+
+
+def test_pool_hint_comes_from_each_blocks_own_coinbase():
+    # Every block used to be attributed from the last input block's coinbase
+    # (all "ViaBTC" here); each now gets its own.
+    signals, _ = detect_signals(BLOCKS)
+    assert [s.pool for s in signals] == ["Foundry USA", "AntPool", "unknown", "ViaBTC"]
+
+
+def test_pool_hint_matches_across_parallel_runs():
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        parallel, _ = detect_signals(BLOCKS, executor=ex, chunk_size=1)
+    serial, _ = detect_signals(BLOCKS)
+    assert [s.pool for s in parallel] == [s.pool for s in serial]
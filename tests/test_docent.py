@@ -0,0 +1,37 @@
+import json
+
+import pytest
+
+from core import docent
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(docent, "CACHE_PATH", str(tmp_path / "docent_cache.jsonl"))
+    monkeypatch.setattr(docent, "CACHE_DB_PATH", str(tmp_path / "docent_cache.db"))
+    monkeypatch.setattr(docent, "_CONN", None)
+    yield tmp_path
+    if docent._CONN is not None:
+        docent._CONN.close()
+
+
+def test_legacy_jsonl_cache_is_imported(cache):
+    now = 2_000_000_000
+    rows = [
+        {"ts": now - 10, "k": "a", "headline": "old", "text": "first"},
+        "not json",
+        {"ts": now, "k": "a", "headline": "new", "text": "second"},
+    ]
+    (cache / "docent_cache.jsonl").write_text(
+        "".join((r if isinstance(r, str) else json.dumps(r)) + "\n" for r in rows)
+    )
+    hit = docent._read_cached("a")
+    assert (hit["headline"], hit["text"]) == ("new", "second")
+
+
+def test_unusable_cache_is_a_miss(cache, monkeypatch):
+    # A directory where the DB file should be: sqlite cannot open it.
+    (cache / "docent_cache.db").mkdir()
+    assert docent._read_cached("a") is None
+    docent._write_cached("a", {"headline": "h", "text": "t"})  # must not raise
+    assert docent.describe_block({"height": 1}, use_llm=False)["headline"]
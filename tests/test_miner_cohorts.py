@@ -0,0 +1,23 @@
+import json
+
+from utils.miner_cohorts import compute_miner_cohort_tilt, load_window_blocks
+
+
+def _catalog(tmp_path):
+    path = tmp_path / "block_catalog.jsonl"
+    rows = [{"height": h, "pool_name": "Edge" if h in (99, 100, 109, 110) else "Mid"} for h in range(95, 115)]
+    path.write_text("".join(json.dumps(r) + "\n" for r in rows))
+    return path
+
+
+def test_legacy_range_and_window_range_select_the_same_blocks(tmp_path):
+    path = _catalog(tmp_path)
+    legacy = range(100, 110)
+    picked = [b["height"] for b in load_window_blocks(path, (legacy.start, legacy.stop - 1))]
+    assert picked == list(legacy)
+
+    old = compute_miner_cohort_tilt("2026-10-16", path, window_heights=legacy)
+    new = compute_miner_cohort_tilt("2026-10-16", path, window_range=(100, 109))
+    assert old == new
+    # Edge blocks 100 and 109 are in; 99 and 110 are not.
+    assert (old.dominant_pool, old.dominant_share) == ("Mid", 0.8)
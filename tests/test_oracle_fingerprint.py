@@ -0,0 +1,14 @@
+from utils.oracle_fingerprint import compute_oracle_input_hash
+
+
+def test_signed_zero_hashes_differ_like_their_json():
+    # 0.0 == -0.0 in Python, but the canonical JSON (and so the hash) differs.
+    pos = compute_oracle_input_hash({"cti": 0.0})
+    neg = compute_oracle_input_hash({"cti": -0.0})
+    assert pos != neg
+    assert compute_oracle_input_hash({"cti": 0.0}) == pos
+
+
+def test_hash_ignores_non_measurement_fields():
+    base = {"regime": "COMPRESSION", "cti": 42.0}
+    assert compute_oracle_input_hash(base) == compute_oracle_input_hash({**base, "price_usd": 1.0})
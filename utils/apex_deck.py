@@ -7,6 +7,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Sequence
 
+from utils.oracle_fingerprint import safe_str_tail
+
 
 @dataclass
 class BlockSummary:
@@ -61,8 +63,7 @@ def _resolve_wavefunction_dominant(wave: Dict[str, Any], regime_state: Dict[str,
 
 
 def render_sovereign_oracle_section(daily_state: Dict[str, Any]) -> List[str]:
-    oih = daily_state.get("oracle_input_hash")
-    short_oih = oih[-8:] if isinstance(oih, str) and len(oih) >= 8 else "N/A"
+    short_oih = safe_str_tail(daily_state.get("oracle_input_hash"))
 
     lines = []
     lines.append("-------------------------------------")
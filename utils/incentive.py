@@ -1,5 +1,15 @@
 from typing import Dict, Any
 
+# Driver direction per custody direction / mempool intent state; anything
+# not listed is neutral (0.0).
+_CUSTODY_SIGN = {"marketward": +1.0, "vaultward": -1.0}
+_INTENT_SIGN = {
+    "SURGING": +1.0,
+    "ELEVATING": +1.0,
+    "BLEEDING": -1.0,
+    "PURGE": -1.0,
+}
+
 def compute_drivers(daily_state: Dict[str, Any],
                     memory_state: Dict[str, Any],
                     mempool_state: Dict[str, Any]) -> Dict[str, float]:
@@ -12,23 +22,13 @@ def compute_drivers(daily_state: Dict[str, Any],
     streak = int(memory_state.get("custody_streak", 0))
     streak_factor = min(max(streak, 0) / 7.0, 1.0)
 
-    if direction == "marketward":
-        custody_driver = +1.0 * streak_factor
-    elif direction == "vaultward":
-        custody_driver = -1.0 * streak_factor
-    else:
-        custody_driver = 0.0
+    custody_driver = _CUSTODY_SIGN.get(direction, 0.0) * streak_factor
 
     # Mempool driver
     intent_state = mempool_state.get("state", "NEUTRAL")
     mpi = float(mempool_state.get("mpi", 0.0))
 
-    if intent_state in ("SURGING", "ELEVATING"):
-        base = +1.0
-    elif intent_state in ("BLEEDING", "PURGE"):
-        base = -1.0
-    else:
-        base = 0.0
+    base = _INTENT_SIGN.get(intent_state, 0.0)
 
     mpi_factor = max(0.0, min(abs(mpi), 0.5)) / 0.5 if mpi is not None else 0.0
     mempool_driver = base * (0.5 + 0.5 * mpi_factor)
@@ -3,7 +3,7 @@
 from __future__ import annotations
 from dataclasses import dataclass, asdict
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 import json
 from collections import Counter, defaultdict
 from statistics import mean
@@ -16,17 +16,19 @@ class MinerCohortTilt:
     tilt_label: str
     narrative: str
 
-def load_window_blocks(block_catalog_path: Path, window_heights: range) -> List[Dict[str, Any]]:
+def load_window_blocks(block_catalog_path: Path, window_range: Tuple[int, int]) -> List[Dict[str, Any]]:
     """
-    block_catalog.jsonl contains full history; we care only about blocks in the given height range.
+    block_catalog.jsonl contains full history; we care only about blocks with
+    low <= height <= high for window_range = (low, high).
     Assumes each line has at least: height, pool_name, entropy_score, avg_fee_rate_sat_vb.
     """
     blocks = []
-    if not block_catalog_path.exists():
+    low, high = window_range
+    try:
+        f = block_catalog_path.open("rb")
+    except FileNotFoundError:
         return blocks
-    low = window_heights.start
-    high = window_heights.stop
-    with block_catalog_path.open("r", encoding="utf-8") as f:
+    with f:
         for line in f:
             if not line.strip():
                 continue
@@ -40,9 +42,14 @@ def load_window_blocks(block_catalog_path: Path, window_heights: range) -> List[
 def compute_miner_cohort_tilt(
     date_utc: str,
     block_catalog_path: Path,
-    window_heights: range,
+    window_heights: Optional[range] = None,
+    window_range: Optional[Tuple[int, int]] = None,
 ) -> MinerCohortTilt | None:
-    blocks = load_window_blocks(block_catalog_path, window_heights)
+    if window_range is None:
+        if window_heights is None:
+            raise TypeError("compute_miner_cohort_tilt needs window_range or window_heights")
+        window_range = (window_heights.start, window_heights.stop - 1)
+    blocks = load_window_blocks(block_catalog_path, window_range)
     if not blocks:
         return None
 
@@ -28,6 +28,13 @@ MEASUREMENT_FIELDS = [
     "regime_integrity",       # e.g. COILED / FRACTURING / BROKEN
 ]
 
+def safe_str_tail(v: Any, n: int = 8, default: str = "N/A") -> str:
+    """
+    Last ``n`` characters of ``v`` when it is a string at least that long,
+    otherwise ``default``. Used to show short oracle fingerprints.
+    """
+    return v[-n:] if type(v) is str and len(v) >= n else default
+
 def build_measurement_vector(daily_state: Dict[str, Any]) -> Dict[str, Any]:
     """
     Extracts the measurement-only vector used to construct the oracle fingerprint.
@@ -47,5 +54,4 @@ def compute_oracle_input_hash(daily_state: Dict[str, Any]) -> str:
     """
     vec = build_measurement_vector(daily_state)
     payload = json.dumps(vec, sort_keys=True, separators=(",", ":"))
-    h = hashlib.sha256(payload.encode("utf-8")).hexdigest()
-    return h
\ No newline at end of file
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()